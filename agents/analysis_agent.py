@@ -30,8 +30,9 @@ def analysis_agent(state: WorkflowState) -> WorkflowState:
         
         log_message(agent_name, "Running LLM-based document analysis...")
         
-        # Execute analysis
-        analysis_result = run_analysis()
+        # Execute analysis on the metadata the processing stage handed over,
+        # rather than re-reading and re-parsing scraping_metadata.json
+        analysis_result = run_analysis(processing_result)
         
         # Update state with results
         state["analysis_result"] = analysis_result
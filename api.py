@@ -2,6 +2,7 @@ from flask import Flask, request, jsonify, send_file
 from flask_cors import CORS
 from typing import List, Dict, Any, Optional
 import os
+import logging
 import json
 import threading
 from datetime import datetime
@@ -1264,6 +1265,8 @@ def get_api_documentation():
     return jsonify(docs)
 
 if __name__ == "__main__":
+    # Library modules (e.g. the scraper) only create loggers; show their progress here
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🚀 Starting SEBI Document Processing API...")
     print("📖 API Documentation available at: http://localhost:8000/api/docs")
     print("🔧 Health check: http://localhost:8000/")
@@ -1,10 +1,52 @@
+import os
+import argparse
+import logging
+
 # Import the LangGraph workflow
 from langgraph_workflow import (
-    run_custom_sebi_workflow
+    run_custom_sebi_workflow,
+    shard_page_numbers,
+    shard_workdir
 )
 from langsmith_config import get_langsmith_config
 
+def shard_spec(value):
+    """argparse type for `--shard i/N`: returns (shard_id, num_shards)"""
+    try:
+        shard_id, num_shards = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected I/N (e.g. 0/4), got {value!r}")
+    if num_shards < 1 or not 0 <= shard_id < num_shards:
+        raise argparse.ArgumentTypeError(f"shard index must be between 0 and N-1, got {value!r}")
+    return shard_id, num_shards
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the SEBI document processing workflow")
+    parser.add_argument(
+        "--shard", type=shard_spec, default=(0, 1), metavar="I/N",
+        help="process only shard I of N (round-robin over the pages), in its own working directory"
+    )
+    return parser.parse_args(argv)
+
 def main():
+    args = parse_args()
+    shard_id, num_shards = args.shard
+    
+    pages = [2]
+    if num_shards > 1:
+        pages = shard_page_numbers(pages, shard_id, num_shards)
+        print(f"🧩 Shard {shard_id}/{num_shards}: pages {pages}")
+        if not pages:
+            print("⏭️  No pages assigned to this shard - nothing to do")
+            return 0
+        
+        # Downloads, output/, caches and result files all use paths relative to
+        # the working directory, so each shard gets a directory of its own
+        workdir = shard_workdir(shard_id, num_shards)
+        os.makedirs(os.path.join(workdir, "output"), exist_ok=True)
+        os.chdir(workdir)
+        print(f"📁 Shard working directory: {os.getcwd()}")
+    
     # Display LangSmith status
     config = get_langsmith_config()
     print("📊 LangSmith Status:")
@@ -16,7 +58,7 @@ def main():
     
     try:
         print("🔧 Running in CUSTOM mode...")
-        result = run_custom_sebi_workflow([2])    
+        result = run_custom_sebi_workflow(pages)
         
         if config['tracing_enabled']:
             print(f"📈 LangSmith Project: {config['project']}")
@@ -40,5 +82,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Library modules (e.g. the scraper) only create loggers; show their progress here
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     # If no command line args, run in test mode
     main()
\ No newline at end of file
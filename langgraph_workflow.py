@@ -1,6 +1,11 @@
-import json
-from typing import Dict, List, Any, TypedDict, Annotated
+import os
+import uuid
+import threading
+from typing import Dict, List, Any, Tuple, TypedDict, Annotated
 from datetime import datetime
+
+from tool.jsonSerializer.index import dump_json_bytes
+
 # Load environment variables
 from dotenv import load_dotenv
 
@@ -34,36 +39,46 @@ else:
     print("   Workflow will continue but tracing may not work properly.")
 
 
+# Workflow IDs are the run's start time; saved results are named after the ID
+WORKFLOW_ID_FORMAT = "sebi_workflow_%Y%m%d_%H%M%S"
+_results_file_name = "workflow_results_{}.json".format
+
 # conditional routing functions
 
+# Routing table for the conditional edges: (stage, stage succeeded) -> next node.
+# Built once at import so each routing decision is a single dict lookup.
+_TRANSITIONS: Dict[Tuple[str, bool], str] = {
+    ("web_scraping", True): "document_processing",
+    ("web_scraping", False): "finalize",
+    ("document_processing", True): "analysis",
+    ("document_processing", False): "finalize",
+    ("analysis", True): "database_loading",
+    ("analysis", False): "finalize",
+}
+
+def _stage_targets(stage: str) -> List[str]:
+    """Nodes a conditional edge out of `stage` can route to"""
+    return [_TRANSITIONS[(stage, True)], _TRANSITIONS[(stage, False)]]
+
 @traceable(name="check_scraping_success")
 def check_scraping_success(state: WorkflowState) -> str:
     """Check if scraping was successful"""
-    scraping_result = state.get("scraping_result", {})
-    if scraping_result.get("total_downloaded_files", 0) > 0:
-        return "continue"
-    return "end"
+    scraping_result = state.get("scraping_result") or {}
+    return _TRANSITIONS[("web_scraping", scraping_result.get("total_downloaded_files", 0) > 0)]
 
 @traceable(name="check_processing_success")
 def check_processing_success(state: WorkflowState) -> str:
     """Check if processing was successful"""
-    processing_result = state.get("processing_result")
-    if processing_result and "pdf_processing" in processing_result:
-        processed_count = processing_result["pdf_processing"].get("processed_files_count", 0)
-        if processed_count > 0:
-            return "continue"
-    return "end"
+    processing_result = state.get("processing_result") or {}
+    pdf_processing = processing_result.get("pdf_processing") or {}
+    return _TRANSITIONS[("document_processing", pdf_processing.get("processed_files_count", 0) > 0)]
 
 @traceable(name="check_analysis_success")
 def check_analysis_success(state: WorkflowState) -> str:
     """Check if analysis was successful"""
-    analysis_result = state.get("analysis_result", {})
-    if analysis_result and "documents" in analysis_result:
-        documents = analysis_result["documents"]
-        successful_analyses = [doc for doc in documents if "error" not in doc]
-        if len(successful_analyses) > 0:
-            return "continue"
-    return "end"
+    analysis_result = state.get("analysis_result") or {}
+    documents = analysis_result.get("documents") or []
+    return _TRANSITIONS[("analysis", any("error" not in doc for doc in documents))]
 
 @traceable(name="finalize_workflow")
 def finalize_workflow(state: WorkflowState) -> WorkflowState:
@@ -213,26 +228,17 @@ def create_workflow() -> StateGraph:
     workflow.add_conditional_edges(
         "web_scraping",
         check_scraping_success,
-        {
-            "continue": "document_processing",
-            "end": "finalize"
-        }
+        _stage_targets("web_scraping")
     )
     workflow.add_conditional_edges(
         "document_processing",
         check_processing_success,
-        {
-            "continue": "analysis",
-            "end": "finalize"
-        }
+        _stage_targets("document_processing")
     )
     workflow.add_conditional_edges(
         "analysis",
         check_analysis_success,
-        {
-            "continue": "database_loading",
-            "end": "finalize"
-        }
+        _stage_targets("analysis")
     )
     workflow.add_edge("database_loading", "team_assignments")
     workflow.add_edge("team_assignments", "finalize")
@@ -240,6 +246,55 @@ def create_workflow() -> StateGraph:
     
     return workflow
 
+def _write_json_streaming(path: str, data: Dict[str, Any]) -> None:
+    """
+    Write a dict as a JSON object one top-level key at a time, so only a single
+    serialized value (e.g. all extracted text of one stage) is held in memory
+    at once instead of the whole document. The object is written to a temp
+    file that replaces the target only once complete.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(b'{')
+        separator = b'\n  '
+        for key, value in data.items():
+            f.write(separator)
+            f.write(dump_json_bytes(str(key), indent=False))
+            f.write(b': ')
+            f.write(dump_json_bytes(value, indent=False, default=str))
+            separator = b',\n  '
+        f.write(b'\n}' if data else b'}')
+    os.replace(tmp_path, path)
+
+# The graph is identical for every run, so build and compile it once and reuse it
+_CHECKPOINTER = MemorySaver()
+_APP = None
+_APP_LOCK = threading.Lock()
+
+def get_workflow_app():
+    """Return the compiled workflow, compiling it on first use"""
+    global _APP
+    if _APP is None:
+        with _APP_LOCK:
+            if _APP is None:
+                _APP = create_workflow().compile(checkpointer=_CHECKPOINTER)
+    return _APP
+
+def shard_page_numbers(page_numbers: List[int], shard_id: int, num_shards: int) -> List[int]:
+    """
+    Deterministically pick this shard's share of the pages (round-robin), so a
+    large crawl can be split across processes or machines. The workflow reads
+    and writes fixed paths relative to the working directory, so every shard
+    has to run in its own directory (see shard_workdir and `app.py --shard`)
+    """
+    if num_shards < 1 or not 0 <= shard_id < num_shards:
+        raise ValueError(f"Invalid shard {shard_id}/{num_shards}")
+    return page_numbers[shard_id::num_shards]
+
+def shard_workdir(shard_id: int, num_shards: int) -> str:
+    """Working directory of one shard, holding its downloads, output/ and caches"""
+    return os.path.join("shards", f"shard-{shard_id}-of-{num_shards}")
+
 # Convenience functions to run the workflow
 @traceable(name="run_sebi_workflow", metadata={"workflow_type": "sebi_document_processing"})
 def run_sebi_workflow(
@@ -251,7 +306,8 @@ def run_sebi_workflow(
     print("="*60)
     
     # Initialize workflow state
-    workflow_id = f"sebi_workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    started_at = datetime.now()
+    workflow_id = started_at.strftime(WORKFLOW_ID_FORMAT)
     initial_state: WorkflowState = {
         "page_numbers": page_numbers,
         "download_folder": download_folder,
@@ -263,20 +319,21 @@ def run_sebi_workflow(
         "ai_assignments": [],
         "current_stage": "initialized",
         "workflow_id": workflow_id,
-        "start_time": datetime.now().isoformat(),
+        "start_time": started_at.isoformat(),
         "errors": [],
         "messages": []
     }
     
-    # Create workflow
-    workflow = create_workflow()
-    
-    # Create runnable workflow
-    app = workflow.compile(checkpointer=MemorySaver())
-    
-    # Run the workflow
-    config = {"configurable": {"thread_id": workflow_id}}
-    final_state = app.invoke(initial_state, config)
+    # Run the workflow on the shared compiled graph. The checkpointer is shared
+    # too, so give every run its own thread and drop its checkpoints afterwards.
+    app = get_workflow_app()
+    thread_id = f"{workflow_id}_{uuid.uuid4().hex[:8]}"
+    config = {"configurable": {"thread_id": thread_id}}
+    try:
+        final_state = app.invoke(initial_state, config)
+    finally:
+        if hasattr(_CHECKPOINTER, "delete_thread"):
+            _CHECKPOINTER.delete_thread(thread_id)
     
     return final_state
 
@@ -291,9 +348,8 @@ def run_custom_sebi_workflow(
     
     if save_results:
         # Save workflow results to JSON file
-        results_file = f"workflow_results_{result['workflow_id']}.json"
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+        results_file = _results_file_name(result['workflow_id'])
+        _write_json_streaming(results_file, result)
         print(f"💾 Workflow results saved to: {results_file}")
     
     return result
@@ -1,5 +1,9 @@
 import os
 import json
+import hashlib
+import sqlite3
+import threading
+import time
 import aiohttp
 import asyncio
 from typing import Dict, List, Optional, Union, Literal, Callable
@@ -36,6 +40,76 @@ class PWCModels:
 
 PWCModel = Literal["bedrock.anthropic.claude-sonnet-4", "vertex_ai.gemini-2.0-flash", "azure.gpt-4o"]
 
+# Exact-match response cache - re-processed circulars skip the LLM round-trip.
+# Set LLM_CACHE_PATH to an empty string to disable caching.
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache.sqlite")
+# Part of every cache key - bump to invalidate cached responses when the way
+# they are consumed changes without the request body changing
+LLM_CACHE_VERSION = "1"
+# Cached responses older than this many seconds are ignored and purged; set
+# LLM_CACHE_TTL_SECONDS to 0 to keep them forever
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+
+_cache_conn: Optional[sqlite3.Connection] = None
+_cache_lock = threading.Lock()
+
+def _get_cache_connection() -> Optional[sqlite3.Connection]:
+    """Open the response cache on first use, or return None if caching is disabled."""
+    global _cache_conn
+    if not LLM_CACHE_PATH:
+        return None
+    with _cache_lock:
+        if _cache_conn is None:
+            conn = sqlite3.connect(LLM_CACHE_PATH, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+            )
+            # Caches written before entries expired have no timestamp; their rows
+            # default to 0 and are purged below as expired
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(llm_cache)")}
+            if "created_at" not in columns:
+                conn.execute("ALTER TABLE llm_cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+            if LLM_CACHE_TTL_SECONDS:
+                conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - LLM_CACHE_TTL_SECONDS,))
+            conn.commit()
+            _cache_conn = conn
+        return _cache_conn
+
+def _cache_key(body: Dict) -> str:
+    """SHA-256 of the full request body and LLM_CACHE_VERSION, so any change to model, prompt or options misses."""
+    payload = LLM_CACHE_VERSION + json.dumps(body, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _cache_get(key: str) -> Optional[Dict]:
+    conn = _get_cache_connection()
+    if conn is None:
+        return None
+    oldest = time.time() - LLM_CACHE_TTL_SECONDS if LLM_CACHE_TTL_SECONDS else 0
+    try:
+        with _cache_lock:
+            row = conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ? AND created_at >= ?", (key, oldest)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    except (sqlite3.Error, ValueError) as error:
+        print(f"Warning: LLM cache lookup failed: {error}")
+        return None
+
+def _cache_put(key: str, response: Dict) -> None:
+    conn = _get_cache_connection()
+    if conn is None:
+        return
+    try:
+        with _cache_lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(response, ensure_ascii=False), time.time()),
+            )
+            conn.commit()
+    except (sqlite3.Error, TypeError, ValueError) as error:
+        print(f"Warning: LLM cache write failed: {error}")
+
 @traceable(name="call_pwc_genai", metadata={"service": "pwc_genai"})
 async def call_pwc_genai(model: str, prompt: str, options: Dict = None) -> Dict:
     """
@@ -74,6 +148,13 @@ async def call_pwc_genai(model: str, prompt: str, options: Dict = None) -> Dict:
     # Merge default body with any provided options, allowing overrides
     body = {**default_body, **options}
     
+    # SQLite calls block, so run them off the event loop to keep concurrent
+    # requests flowing while another coroutine reads or writes the cache
+    cache_key = _cache_key(body)
+    cached = await asyncio.to_thread(_cache_get, cache_key)
+    if cached is not None:
+        return cached
+    
     try:
         async with aiohttp.ClientSession() as session:
             async with session.post(url, headers=headers, json=body) as response:
@@ -88,6 +169,7 @@ async def call_pwc_genai(model: str, prompt: str, options: Dict = None) -> Dict:
                     raise Exception(f"HTTP error! status: {response.status}, message: {error_message}")
                 
                 data = await response.json()
+                await asyncio.to_thread(_cache_put, cache_key, data)
                 return data
         
     except Exception as error:
@@ -184,8 +266,8 @@ def parse_json_response(response: Dict, key: str = None) -> Union[Dict, List]:
         content = re.sub(r',\s*}', '}', content)
         content = re.sub(r',\s*]', ']', content)
         
-        # Handle unterminated strings
-        if not content.endswith("}"):
+        # Handle unterminated strings (batched responses are JSON arrays)
+        if not content.endswith(("}", "]")):
             last_complete_object = content.rfind("}")
             if last_complete_object > 0:
                 content = content[:last_complete_object + 1]
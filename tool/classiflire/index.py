@@ -1,12 +1,64 @@
 import json
 import os
+import re
+import copy
 import asyncio
-from typing import Dict, List, Optional
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
 from ..LLM.index import generate_with_prompt, parse_json_response
+from ..jsonSerializer.index import dump_json_bytes, dump_json_line
 
 # LangSmith tracing
 from langsmith import traceable
 
+# Maximum number of document analyses sent to the LLM at the same time
+LLM_MAX_CONCURRENCY = 8
+
+# Number of documents packed into a single LLM prompt. Each circular produces a
+# large structured response, so batches stay small to fit the output budget
+ANALYSIS_BATCH_SIZE = 4
+
+# Combined document characters allowed in one batched prompt. Long circulars
+# would push a batch past the model's context window, fail, and then be re-run
+# one by one; a document larger than this is analyzed on its own
+ANALYSIS_BATCH_MAX_CHARS = 60_000
+
+# Per-document analyses of the current run, one JSON object per line, written
+# as each batch completes so a long run's progress survives an interruption.
+# The file is truncated when a run starts so it never mixes runs
+ANALYSIS_RECORDS_FILE = "output/sebi_document_analysis_results.jsonl"
+
+
+def _content_fingerprint(text: str) -> str:
+    """Hash of the whitespace-normalized text, so re-extracted copies of the same circular match."""
+    return hashlib.sha256(re.sub(r"\s+", " ", text).strip().encode("utf-8")).hexdigest()
+
+
+def _pack_batches(documents: List[Dict]) -> List[List[Dict]]:
+    """
+    Group documents, in order, into batches of at most ANALYSIS_BATCH_SIZE
+    documents and ANALYSIS_BATCH_MAX_CHARS characters of content.
+    
+    Args:
+        documents (List[Dict]): Documents with a "content" key
+        
+    Returns:
+        List[List[Dict]]: The batches, covering every document exactly once
+    """
+    batches = []
+    batch: List[Dict] = []
+    batch_chars = 0
+    for doc in documents:
+        doc_chars = len(doc["content"])
+        if batch and (len(batch) >= ANALYSIS_BATCH_SIZE or batch_chars + doc_chars > ANALYSIS_BATCH_MAX_CHARS):
+            batches.append(batch)
+            batch, batch_chars = [], 0
+        batch.append(doc)
+        batch_chars += doc_chars
+    if batch:
+        batches.append(batch)
+    return batches
+
 teams = [
   {
     "id": "148ab232-7196-4e85-8a30-d28a33d51003",
@@ -228,6 +280,32 @@ Respond only with valid JSON. Ensure all nested objects follow the specified str
     
     return prompt
 
+def create_batch_analysis_prompt(documents: List[Dict]) -> str:
+    """
+    Create a single analysis prompt covering several SEBI documents.
+    
+    The shared instructions, department, intermediary and team lists are sent
+    once for the whole batch instead of once per document.
+    
+    Args:
+        documents (List[Dict]): Documents with "id" and "content" keys
+        
+    Returns:
+        str: Analysis prompt asking for one JSON object per document
+    """
+    
+    items = json.dumps(
+        [{"id": doc["id"], "content": doc["content"]} for doc in documents],
+        ensure_ascii=False
+    )
+    
+    return create_analysis_prompt(items) + f"""
+BATCH INSTRUCTIONS:
+The DOCUMENT CONTENT above is a JSON array of {len(documents)} separate documents, each with an "id" and its "content".
+Analyze every document independently and respond with a JSON array containing exactly one object per document, in the same order.
+Each object must follow the structure above and additionally include the "id" of the document it describes.
+"""
+
 @traceable(name="analyze_document_content", metadata={"tool": "document_classifier"})
 async def analyze_document_content(content: str, filename: str = "") -> Dict:
     
@@ -265,23 +343,78 @@ async def analyze_document_content(content: str, filename: str = "") -> Dict:
             "error": str(e)
         }
 
+@traceable(name="analyze_document_batch", metadata={"tool": "document_classifier"})
+async def analyze_document_batch(documents: List[Dict]) -> List[Dict]:
+    """
+    Analyze several documents with a single LLM call.
+    
+    Falls back to one call per document when the batched response cannot be
+    matched back to every document in the batch.
+    
+    Args:
+        documents (List[Dict]): Documents with "id", "filename" and "content" keys
+        
+    Returns:
+        List[Dict]: One analysis per document, in input order
+    """
+    
+    if len(documents) == 1:
+        doc = documents[0]
+        return [await analyze_document_content(content=doc["content"], filename=doc["filename"])]
+    
+    try:
+        response = await generate_with_prompt(
+            prompt=create_batch_analysis_prompt(documents),
+            model="vertex_ai.gemini-2.0-flash",
+            temperature=0.1,
+            top_p=0.95
+        )
+        parsed = parse_json_response(response)
+        if not isinstance(parsed, list):
+            raise ValueError("batched response is not a JSON array")
+        
+        by_id = {str(item.get("id")): item for item in parsed if isinstance(item, dict)}
+        missing = [doc["filename"] for doc in documents if doc["id"] not in by_id]
+        if missing:
+            raise ValueError(f"batched response is missing {len(missing)} document(s)")
+        
+        analyses = []
+        for doc in documents:
+            analysis = by_id[doc["id"]]
+            analysis.pop("id", None)
+            analysis["filename"] = doc["filename"]
+            analysis["content_length"] = len(doc["content"])
+            analyses.append(analysis)
+        return analyses
+        
+    except Exception as e:
+        print(f"Batched analysis failed ({str(e)}), analyzing {len(documents)} documents individually")
+        return list(await asyncio.gather(
+            *(analyze_document_content(content=doc["content"], filename=doc["filename"]) for doc in documents)
+        ))
+
 @traceable(name="process_scraping_metadata", metadata={"tool": "sebi_document_processor"})
-async def process_scraping_metadata() -> Dict:
+async def process_scraping_metadata(metadata: Optional[Dict] = None) -> Dict:
     """
     Main function to process scraping_metadata.json file and analyze all documents
     
+    Args:
+        metadata (Optional[Dict]): Already-loaded scraping metadata, e.g. the
+            document processing result. Read from output/scraping_metadata.json if None.
+    
     Returns:
         Dict: Complete analysis results for all documents
     """
     
-    # Load the scraping metadata
-    metadata_path = os.path.join(os.getcwd(), "output", "scraping_metadata.json")
-    
-    if not os.path.exists(metadata_path):
-        raise FileNotFoundError(f"scraping_metadata.json not found in current directory")
-    
-    with open(metadata_path, 'r', encoding='utf-8') as f:
-        metadata = json.load(f)
+    # Load the scraping metadata unless the caller already holds it in memory
+    if metadata is None:
+        metadata_path = os.path.join(os.getcwd(), "output", "scraping_metadata.json")
+        
+        if not os.path.exists(metadata_path):
+            raise FileNotFoundError(f"scraping_metadata.json not found in current directory")
+        
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
     
     # Extract files information from all page results
     page_results = metadata.get('page_results', [])
@@ -305,55 +438,95 @@ async def process_scraping_metadata() -> Dict:
         "documents": []
     }
     
-    # Process each file
+    # Collect the documents that have text to analyze. SEBI lists the same
+    # circular under several links, so documents with identical (whitespace-
+    # normalized) text are analyzed once and the result is shared
+    documents = []
+    duplicates: Dict[str, List[Dict]] = {}
     for i, file_info in enumerate(files_info, 1):
-        print(f"Processing file {i}/{len(files_info)}: {file_info.get('original_filename', 'Unknown')}")
-        
-        try:
-            # Get extracted content
-            extracted_content = file_info.get('extracted_content', {})
-            text_content = extracted_content.get('text', '')
-            
-            if not text_content:
-                print(f"Warning: No text content found for {file_info.get('original_filename')}")
-                continue
+        text_content = file_info.get('extracted_content', {}).get('text', '')
+        if not text_content:
+            print(f"Warning: No text content found for {file_info.get('original_filename')}")
+            continue
+        doc = {
+            "id": str(i),
+            "filename": file_info.get('original_filename', f"file_{i}"),
+            "content": text_content,
+            "file_info": file_info,
+            "fingerprint": _content_fingerprint(text_content)
+        }
+        if doc["fingerprint"] in duplicates:
+            duplicates[doc["fingerprint"]].append(doc)
+        else:
+            duplicates[doc["fingerprint"]] = []
+            documents.append(doc)
+    
+    duplicate_count = sum(len(docs) for docs in duplicates.values())
+    if duplicate_count:
+        print(f"Reusing analysis for {duplicate_count} document(s) with identical content")
+    
+    # Pack documents into batches so the prompt preamble is sent once per batch,
+    # and analyze the batches concurrently while capping how many are in flight
+    batches = _pack_batches(documents)
+    semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    os.makedirs(os.path.dirname(ANALYSIS_RECORDS_FILE), exist_ok=True)
+    records_file = open(ANALYSIS_RECORDS_FILE, 'wb')
+    
+    async def analyze_batch(batch_number: int, batch: List[Dict]) -> List[Tuple[int, Dict]]:
+        async with semaphore:
+            print(f"Processing batch {batch_number}/{len(batches)}: {', '.join(doc['filename'] for doc in batch)}")
             
-            # Analyze the document
-            analysis = await analyze_document_content(
-                content=text_content,
-                filename=file_info.get('original_filename', f"file_{i}")
-            )
+            try:
+                analyses = await analyze_document_batch(batch)
             
-            # Add original file metadata
-            analysis["original_metadata"] = {
-                "circular_number": file_info.get('circular_number'),
-                "circular_date": file_info.get('circular_date'),
-                "url": file_info.get('url'),
-                "source_url": file_info.get('source_url'),
-                "link_text": file_info.get('link_text')
-            }
+            except Exception as e:
+                print(f"Error processing batch {batch_number}: {str(e)}")
+                analyses = [
+                    {
+                        "filename": doc["filename"],
+                        "department": "Processing Failed",
+                        "intermediary": [],
+                        "key_clauses": [],
+                        "key_metrics": [],
+                        "actionable_items": [],
+                        "error": str(e)
+                    }
+                    for doc in batch
+                ]
             
-            analysis_results["documents"].append(analysis)
+            # Add original file metadata, copying the analysis to any duplicates
+            results = []
+            for doc, analysis in zip(batch, analyses):
+                for target in [doc] + duplicates[doc["fingerprint"]]:
+                    if target is not doc:
+                        analysis = copy.deepcopy(analysis)
+                        analysis["filename"] = target["filename"]
+                    file_info = target["file_info"]
+                    analysis["original_metadata"] = {
+                        "circular_number": file_info.get('circular_number'),
+                        "circular_date": file_info.get('circular_date'),
+                        "url": file_info.get('url'),
+                        "source_url": file_info.get('source_url'),
+                        "link_text": file_info.get('link_text')
+                    }
+                    records_file.write(dump_json_line(analysis))
+                    results.append((int(target["id"]), analysis))
+            records_file.flush()
             
-        except Exception as e:
-            print(f"Error processing file {file_info.get('original_filename')}: {str(e)}")
-            error_analysis = {
-                "filename": file_info.get('original_filename'),
-                "department": "Processing Failed",
-                "intermediary": [],
-                "key_clauses": [],
-                "key_metrics": [],
-                "actionable_items": [],
-                "error": str(e),
-                "original_metadata": {
-                    "circular_number": file_info.get('circular_number'),
-                    "circular_date": file_info.get('circular_date'),
-                    "url": file_info.get('url'),
-                    "source_url": file_info.get('source_url'),
-                    "link_text": file_info.get('link_text')
-                }
-            }
-            analysis_results["documents"].append(error_analysis)
+            return results
+    
+    try:
+        batch_results = await asyncio.gather(
+            *(analyze_batch(batch_number, batch) for batch_number, batch in enumerate(batches, 1))
+        )
+    finally:
+        records_file.close()
+    # Duplicates are analyzed alongside their first copy, so restore the input order
+    analysis_results["documents"] = [
+        analysis for _, analysis in sorted(
+            (result for results in batch_results for result in results), key=lambda result: result[0]
+        )
+    ]
     
     # Add analysis timestamp
     from datetime import datetime
@@ -361,8 +534,8 @@ async def process_scraping_metadata() -> Dict:
     
     # Save results to JSON file
     output_filename = "output/sebi_document_analysis_results.json"
-    with open(output_filename, 'w', encoding='utf-8') as f:
-        json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+    with open(output_filename, 'wb') as f:
+        f.write(dump_json_bytes(analysis_results))
     
     print(f"\nAnalysis complete! Results saved to {output_filename}")
     print(f"Successfully analyzed {len([doc for doc in analysis_results['documents'] if 'error' not in doc])} documents")
@@ -371,15 +544,19 @@ async def process_scraping_metadata() -> Dict:
     return analysis_results
 
 @traceable(name="run_analysis", metadata={"workflow_stage": "document_analysis"})
-def run_analysis():
+def run_analysis(metadata: Optional[Dict] = None):
     """
     Synchronous wrapper function to run the analysis
+    
+    Args:
+        metadata (Optional[Dict]): Already-loaded scraping metadata, see process_scraping_metadata
     """
-    return asyncio.run(process_scraping_metadata())
+    return asyncio.run(process_scraping_metadata(metadata))
 
 # Export the main functions
 __all__ = [
     'process_scraping_metadata',
     'analyze_document_content',
+    'analyze_document_batch',
     'run_analysis'
 ]
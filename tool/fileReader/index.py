@@ -1,15 +1,47 @@
 import os
 import json
+import hashlib
+import multiprocessing
 import PyPDF2
 import pdfplumber
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Dict, List, Any, Optional
 import re
 
 # LangSmith tracing
 from langsmith import traceable
 
+from tool.jsonSerializer.index import dump_json_bytes
+
+# Prefer PyMuPDF for text extraction when it is installed - its C core is much
+# faster than the pure-Python PyPDF2/pdfplumber parsers
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+# Pages where PyMuPDF finds fewer characters than this are re-read with
+# pdfplumber's layout-aware extraction
+PAGE_TEXT_FALLBACK_CHARS = 20
+
+# Worker processes used by process_pdfs_from_folder, and how many PDFs each
+# worker is handed at a time. Workers are spawned rather than forked: the
+# extraction runs inside a LangGraph node while tracer and server threads are
+# alive, and a forked child can deadlock on a lock one of them held
+PDF_EXTRACTION_WORKERS = min(8, os.cpu_count() or 1)
+PDF_EXTRACTION_CHUNKSIZE = 4
+
+# Manifest of previous extractions keyed by PDF content hash, so re-runs only
+# extract new or changed files. Bump the version whenever extraction output
+# changes; set the path to an empty string to disable the cache.
+EXTRACTION_CACHE_PATH = os.getenv("EXTRACTION_CACHE_PATH", os.path.join(".cache", "processed.json"))
+EXTRACTION_PIPELINE_VERSION = "2"
+
+
 # Try to import docling for enhanced processing
 try:
     from .docling_processor import EnhancedPDFProcessor, process_pdfs_with_docling
@@ -88,13 +120,81 @@ def extract_text_from_pdf_pdfplumber(pdf_path: str) -> Dict[str, Any]:
         return {"text": "", "tables": [], "metadata": {}}
 
 
+def extract_text_from_pdf_pymupdf(pdf_path: str, extract_tables: bool = True) -> Dict[str, Any]:
+    """
+    Extract text from PDF using PyMuPDF.
+    Same output shape as the pdfplumber extractor; tables are extracted when
+    the installed PyMuPDF supports it.
+    """
+    try:
+        extracted_data = {
+            "text": "",
+            "tables": [],
+            "metadata": {}
+        }
+        
+        with fitz.open(pdf_path) as pdf:
+            # Extract metadata
+            if pdf.metadata:
+                extracted_data["metadata"] = {
+                    "title": pdf.metadata.get("title", ""),
+                    "author": pdf.metadata.get("author", ""),
+                    "subject": pdf.metadata.get("subject", ""),
+                    "creator": pdf.metadata.get("creator", ""),
+                    "creation_date": pdf.metadata.get("creationDate", ""),
+                    "modification_date": pdf.metadata.get("modDate", ""),
+                    "pages": pdf.page_count
+                }
+            
+            # Extract text from all pages - a bad page is skipped rather than
+            # losing the whole document
+            page_texts = []
+            sparse_pages = []
+            for page_num, page in enumerate(pdf):
+                try:
+                    page_text = page.get_text("text")
+                    if len(page_text.strip()) < PAGE_TEXT_FALLBACK_CHARS:
+                        # Kept as is unless the pdfplumber pass below finds more
+                        sparse_pages.append((len(page_texts), page_num, len(page_text.strip())))
+                    page_texts.append(f"--- Page {page_num + 1} ---\n{page_text}\n\n" if page_text else "")
+                    
+                    # Extract tables from page
+                    if extract_tables and hasattr(page, "find_tables"):
+                        for table_num, table in enumerate(page.find_tables().tables):
+                            extracted_data["tables"].append({
+                                "page": page_num + 1,
+                                "table_number": table_num + 1,
+                                "data": table.extract()
+                            })
+                except Exception as e:
+                    print(f"⚠️  PyMuPDF could not read page {page_num + 1} of {pdf_path}: {e}")
+        
+        # Fall back to pdfplumber only for the (near) empty pages
+        if sparse_pages:
+            try:
+                with pdfplumber.open(pdf_path) as plumber_pdf:
+                    for slot, page_num, found_chars in sparse_pages:
+                        page_text = plumber_pdf.pages[page_num].extract_text()
+                        if page_text and len(page_text.strip()) > found_chars:
+                            page_texts[slot] = f"--- Page {page_num + 1} ---\n{page_text}\n\n"
+            except Exception as e:
+                print(f"⚠️  pdfplumber fallback failed for {pdf_path}: {e}")
+        
+        extracted_data["text"] = "".join(page_texts).strip()
+        
+        return extracted_data
+    except Exception as e:
+        print(f"❌ PyMuPDF extraction failed for {pdf_path}: {e}")
+        return {"text": "", "tables": [], "metadata": {}}
+
+
 def extract_pdf_data(pdf_path: str, use_advanced_extraction: bool = True, use_docling: bool = None) -> Dict[str, Any]:
     """
     Extract comprehensive data from a PDF file.
     
     Args:
         pdf_path: Path to the PDF file
-        use_advanced_extraction: If True, use pdfplumber for better extraction
+        use_advanced_extraction: If True, also extract tables (pdfplumber, or PyMuPDF when installed)
         use_docling: If True and available, use docling for extraction; 
                     if None, auto-detect based on availability (defaults to True if available)
     
@@ -131,15 +231,14 @@ def extract_pdf_data(pdf_path: str, use_advanced_extraction: bool = True, use_do
         }
     
     # Get file information
-    file_info = {
-        "filename": pdf_path.name,
-        "full_path": str(pdf_path.absolute()),
-        "file_size": pdf_path.stat().st_size,
-        "last_modified": datetime.fromtimestamp(pdf_path.stat().st_mtime).isoformat(),
-        "extraction_timestamp": datetime.now().isoformat()
-    }
+    file_info = _pdf_file_info(pdf_path)
     
-    if use_advanced_extraction:
+    if PYMUPDF_AVAILABLE:
+        # Use PyMuPDF for fast extraction, with tables in advanced mode
+        extracted_data = extract_text_from_pdf_pymupdf(str(pdf_path), extract_tables=use_advanced_extraction)
+        extracted_data["file_info"] = file_info
+        extracted_data["extraction_method"] = "PyMuPDF"
+    elif use_advanced_extraction:
         # Use pdfplumber for comprehensive extraction
         extracted_data = extract_text_from_pdf_pdfplumber(str(pdf_path))
         extracted_data["file_info"] = file_info
@@ -158,6 +257,99 @@ def extract_pdf_data(pdf_path: str, use_advanced_extraction: bool = True, use_do
     return extracted_data
 
 
+def _standard_extraction_method(use_advanced_extraction: bool = True) -> str:
+    """
+    Name of the extractor extract_pdf_data uses when docling is not involved.
+    
+    Args:
+        use_advanced_extraction: Whether tables are extracted as well
+    
+    Returns:
+        "PyMuPDF", "pdfplumber" or "PyPDF2", as recorded under "extraction_method"
+    """
+    if PYMUPDF_AVAILABLE:
+        return "PyMuPDF"
+    return "pdfplumber" if use_advanced_extraction else "PyPDF2"
+
+
+def _extraction_cache_key(pdf_path: str, use_docling: bool) -> str:
+    """
+    Build the manifest key for a PDF from its content and the extraction settings.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        use_docling: Whether docling extraction was requested
+    
+    Returns:
+        Hex digest identifying this file's extraction result
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    # The installed extractor changes the output, so switching it must miss
+    digest.update(f"|{EXTRACTION_PIPELINE_VERSION}|{bool(use_docling)}|{_standard_extraction_method()}".encode())
+    return digest.hexdigest()
+
+
+def _pdf_file_info(pdf_path: Path) -> Dict[str, Any]:
+    """
+    Describe a PDF on disk as stored under "file_info" in its extraction result.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        Filename, absolute path, size, modification time and extraction timestamp
+    """
+    stat = pdf_path.stat()
+    return {
+        "filename": pdf_path.name,
+        "full_path": str(pdf_path.absolute()),
+        "file_size": stat.st_size,
+        "last_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        "extraction_timestamp": datetime.now().isoformat()
+    }
+
+
+def _load_extraction_cache() -> Dict[str, Any]:
+    """
+    Load the extraction manifest, treating a missing or unreadable file as empty.
+    
+    Returns:
+        Mapping of cache key to extracted content (everything but "file_info")
+    """
+    if not EXTRACTION_CACHE_PATH or not os.path.exists(EXTRACTION_CACHE_PATH):
+        return {}
+    try:
+        with open(EXTRACTION_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable extraction cache {EXTRACTION_CACHE_PATH}: {e}")
+        return {}
+
+
+def _save_extraction_cache(cache: Dict[str, Any]) -> None:
+    """
+    Write the extraction manifest atomically so an interrupted run cannot corrupt it.
+    
+    Args:
+        cache: Mapping of cache key to extracted content (everything but "file_info")
+    """
+    if not EXTRACTION_CACHE_PATH:
+        return
+    cache_dir = os.path.dirname(EXTRACTION_CACHE_PATH)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{EXTRACTION_CACHE_PATH}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(dump_json_bytes(cache, indent=False))
+        os.replace(tmp_path, EXTRACTION_CACHE_PATH)
+    except Exception as e:
+        print(f"⚠️  Failed to save extraction cache: {e}")
+
+
 def process_pdfs_from_folder(folder_path: str, metadata_json_path: str, use_docling: bool = None) -> Dict[str, Any]:
     """
     Process all PDFs from a folder and update the metadata JSON file with extracted data.
@@ -209,12 +401,50 @@ def process_pdfs_from_folder(folder_path: str, metadata_json_path: str, use_docl
     print(f"📄 Metadata file: {metadata_path}")
     print(f"🔧 Using {'enhanced docling' if use_docling else 'standard'} processing")
     
-    for pdf_file in pdf_files:
+    # Extract all PDFs in worker processes - PyPDF2/pdfplumber are pure Python
+    # and hold the GIL, so threads cannot overlap their parsing - then fold the
+    # results into the metadata in file order. A single file is not worth the
+    # cost of starting the pool.
+    # PDFs whose content was already extracted by an earlier run are taken from
+    # the cache manifest and only the misses are sent to the extractors. The
+    # manifest holds content only; file_info is rebuilt so paths and timestamps
+    # describe this run.
+    extraction_cache = _load_extraction_cache()
+    cache_keys = [_extraction_cache_key(str(pdf_file), use_docling) for pdf_file in pdf_files]
+    extractions = [
+        {**extraction_cache[key], "file_info": _pdf_file_info(pdf_file)} if key in extraction_cache else None
+        for pdf_file, key in zip(pdf_files, cache_keys)
+    ]
+    pending = [index for index, extraction in enumerate(extractions) if extraction is None]
+    cache_hits = len(pdf_files) - len(pending)
+    if cache_hits:
+        print(f"♻️  Reusing cached extraction for {cache_hits} unchanged PDF(s)")
+    
+    pdf_paths = [str(pdf_files[index]) for index in pending]
+    if len(pdf_paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(PDF_EXTRACTION_WORKERS, len(pdf_paths)),
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            new_extractions = list(executor.map(
+                extract_pdf_data, pdf_paths, repeat(True), repeat(use_docling),
+                chunksize=PDF_EXTRACTION_CHUNKSIZE
+            ))
+    else:
+        new_extractions = [extract_pdf_data(path, use_advanced_extraction=True, use_docling=use_docling)
+                           for path in pdf_paths]
+    
+    # Keep only entries for PDFs still in the folder, so deleted or changed
+    # files do not accumulate, and rewrite the manifest only when it changed
+    live_cache = {key: extraction_cache[key] for key in cache_keys if key in extraction_cache}
+    for index, extracted_data in zip(pending, new_extractions):
+        extractions[index] = extracted_data
+        if "error" not in extracted_data:
+            live_cache[cache_keys[index]] = {k: v for k, v in extracted_data.items() if k != "file_info"}
+    if live_cache.keys() != extraction_cache.keys():
+        _save_extraction_cache(live_cache)
+    
+    for pdf_file, extracted_data in zip(pdf_files, extractions):
         print(f"\n🔄 Processing: {pdf_file.name}")
         
-        # Extract PDF data
-        extracted_data = extract_pdf_data(str(pdf_file), use_advanced_extraction=True, use_docling=use_docling)
-        
         if "error" in extracted_data:
             print(f"❌ Failed to process {pdf_file.name}: {extracted_data['error']}")
             continue
@@ -266,18 +496,27 @@ def process_pdfs_from_folder(folder_path: str, metadata_json_path: str, use_docl
         else:
             print(f"⚠️  Could not find metadata entry for {pdf_file.name}")
     
+    # Record the extractors that actually produced this run's text - cache hits
+    # keep the method of the run that extracted them
+    extractors = sorted({
+        extracted_data["extraction_method"] for extracted_data in extractions
+        if "error" not in extracted_data and extracted_data.get("extraction_method")
+    }) or [_standard_extraction_method()]
+    fallback = "pdfplumber fallback" if PYMUPDF_AVAILABLE else "PyPDF2 fallback"
+    
     # Add processing summary to metadata
     metadata["pdf_processing"] = {
         "processing_timestamp": datetime.now().isoformat(),
         "processed_files_count": processed_count,
         "total_pdf_files": len(pdf_files),
-        "processing_method": f"{'enhanced_docling' if use_docling else 'standard'} + pdfplumber + PyPDF2 fallback"
+        "extraction_cache_hits": cache_hits,
+        "processing_method": f"{'enhanced_docling' if use_docling else 'standard'} + {' + '.join(extractors)} + {fallback}"
     }
     
     # Save updated metadata
     try:
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        with open(metadata_path, 'wb') as f:
+            f.write(dump_json_bytes(metadata))
         print(f"\n✅ Successfully updated metadata file with {processed_count} processed PDFs")
         return metadata
     except Exception as e:
@@ -661,6 +900,8 @@ def test_single_pdf(pdf_filename: str, use_docling: bool = None):
     return result
 
 
+# Run from the repository root so the tool package is importable:
+#   python -m tool.fileReader.index --validate-paths
 if __name__ == "__main__":
     # Check if user wants to refactor metadata paths
     import sys
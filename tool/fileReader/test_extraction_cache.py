@@ -0,0 +1,47 @@
+"""
+Tests for the extraction cache manifest used by process_pdfs_from_folder
+"""
+
+import json
+
+import tool.fileReader.index as file_reader
+
+
+def _write_fixture(tmp_path):
+    """Create a folder with one PDF and a scraping_metadata.json that references it"""
+    folder = tmp_path / "pdfs"
+    folder.mkdir()
+    (folder / "circular.pdf").write_bytes(b"%PDF-1.4 test circular")
+    metadata_path = tmp_path / "scraping_metadata.json"
+    metadata_path.write_text(json.dumps({
+        "page_results": [{"files": [{"downloaded_filename": "circular.pdf"}]}]
+    }))
+    return folder, metadata_path
+
+
+def test_switching_extractor_ignores_cached_entry(tmp_path, monkeypatch):
+    """A manifest entry written by one extractor must not be served once another is installed"""
+    folder, metadata_path = _write_fixture(tmp_path)
+    monkeypatch.setattr(file_reader, "EXTRACTION_CACHE_PATH", str(tmp_path / "processed.json"))
+
+    calls = []
+
+    def fake_extract(pdf_path, use_advanced_extraction=True, use_docling=None):
+        method = file_reader._standard_extraction_method(use_advanced_extraction)
+        calls.append(method)
+        return {"text": f"text from {method}", "tables": [], "metadata": {}, "extraction_method": method}
+
+    monkeypatch.setattr(file_reader, "extract_pdf_data", fake_extract)
+
+    monkeypatch.setattr(file_reader, "PYMUPDF_AVAILABLE", False)
+    file_reader.process_pdfs_from_folder(str(folder), str(metadata_path), use_docling=False)
+    # Unchanged settings: the second run is served from the manifest
+    file_reader.process_pdfs_from_folder(str(folder), str(metadata_path), use_docling=False)
+    assert calls == ["pdfplumber"]
+
+    monkeypatch.setattr(file_reader, "PYMUPDF_AVAILABLE", True)
+    result = file_reader.process_pdfs_from_folder(str(folder), str(metadata_path), use_docling=False)
+    assert calls == ["pdfplumber", "PyMuPDF"]
+
+    extracted = result["page_results"][0]["files"][0]["extracted_content"]
+    assert extracted["text"] == "text from PyMuPDF"
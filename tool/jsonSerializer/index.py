@@ -0,0 +1,44 @@
+"""
+Shared JSON serialization for the scraper, extraction, analysis and workflow
+output files. Uses orjson when it is installed (see requirements-optional.txt)
+and falls back to the standard library json module otherwise.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+# orjson is much faster for the large nested result dicts; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dump_json_bytes(data: Any, indent: bool = True, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+    
+    Args:
+        data: Value to serialize
+        indent: Pretty-print with a two-space indent (compact output otherwise)
+        default: Called for objects that are not natively serializable
+        
+    Returns:
+        The encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=default, option=option)
+        except TypeError:
+            # e.g. integers wider than 64 bits - the stdlib encoder handles them
+            pass
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=default).encode("utf-8")
+
+
+def dump_json_line(data: Any) -> bytes:
+    """Serialize data to a single newline-terminated JSON line."""
+    return dump_json_bytes(data, indent=False) + b"\n"
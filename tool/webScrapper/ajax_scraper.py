@@ -3,26 +3,120 @@ from __future__ import annotations
 import os
 import re
 import time
-import json
+import threading
+import logging
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # LangSmith tracing
 from langsmith import traceable
 
+from tool.jsonSerializer.index import dump_json_bytes, dump_json_line
+
+# BeautifulSoup tree builder. The extraction logic is written against
+# html.parser; set SEBI_HTML_PARSER=lxml (see requirements-optional.txt) to opt
+# in to the faster C parser, which can build a slightly different tree from
+# malformed markup.
+HTML_PARSER = os.getenv("SEBI_HTML_PARSER", "html.parser")
+
+
+# Scraper progress log. No handlers are attached here - the entry point
+# (app.py / api.py) decides where records go and how they are formatted.
+log = logging.getLogger(__name__)
+
+# Max number of detail-page URLs memoized per scraper instance
+PAGE_CACHE_SIZE = 4096
+
+# Characters not allowed in downloaded PDF filenames
+_FILENAME_SANITIZE_RE = re.compile(r'[^\w\-_.]')
+
+# Sustained request rate allowed against the SEBI website
+REQUESTS_PER_SECOND = 8.0
+
+# Keep-alive connections pooled per host by the scraper's HTTP session
+HTTP_POOL_SIZE = 20
+
+# PDFs larger than this are skipped instead of downloaded (None disables the limit)
+MAX_PDF_BYTES = 100 * 1024 * 1024
+
+# Listing links processed concurrently per page (detail page fetch + PDF downloads)
+DOWNLOAD_WORKERS = 8
+
+# Chunk and write-buffer size used when streaming PDFs to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    
+    Requests proceed immediately while tokens are available and only sleep
+    once the sustained rate would exceed ``rate`` requests per second.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 0
+            else:
+                self.tokens -= 1
+
+
+def _file_size(path: Path) -> int:
+    """Return a file's size in bytes, or 0 if it does not exist (one stat call)."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
 class SEBIAjaxScraper:
-    def __init__(self, base_url: str = "https://www.sebi.gov.in", download_folder: str = "sebi_ajax_pdfs"):
+    def __init__(self, base_url: str = "https://www.sebi.gov.in", download_folder: str = "sebi_ajax_pdfs",
+                 requests_per_second: float = REQUESTS_PER_SECOND, max_pdf_bytes: Optional[int] = MAX_PDF_BYTES,
+                 download_workers: int = DOWNLOAD_WORKERS):
         self.base_url = base_url
+        self.max_pdf_bytes = max_pdf_bytes
+        self.download_workers = download_workers
         self.download_path = Path(download_folder)
         self.download_path.mkdir(exist_ok=True)
         
         # Setup session with headers from the curl request
         self.session = requests.Session()
+        
+        # Keep a pool of warm keep-alive connections to SEBI and retry transient
+        # failures on idempotent requests instead of losing the whole link.
+        # 429 responses are retried too, waiting for the server's Retry-After
+        # (or the exponential backoff when it sends none)
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                              respect_retry_after_header=True)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             'Accept': '*/*',
             'Accept-Language': 'en-GB,en-US;q=0.9,en;q=0.8',
@@ -39,22 +133,91 @@ class SEBIAjaxScraper:
             'sec-ch-ua-platform': '"Windows"'
         })
         
+        # Be respectful to the server: every outbound request takes a token
+        self.rate_limiter = TokenBucket(requests_per_second)
+        
         # AJAX endpoint
         self.ajax_url = f"{self.base_url}/sebiweb/ajax/home/getnewslistinfo.jsp"
         
+        # PDF URL -> downloaded file, shared across pages and persisted between runs
+        # so PDFs linked from several circulars are only fetched once
+        self._seen_urls_file = self.download_path / ".seen_urls"
+        self._downloaded_pdfs: Dict[str, Path] = self._load_seen_urls()
+        self._seen_urls_lock = threading.Lock()
+        
+        # JSONL record of every file downloaded by this run, written as the scrape
+        # progresses so the metadata survives an interruption. The previous run's
+        # record is replaced by the first download (or dropped when the run saves
+        # its metadata without downloading anything) so runs never mix
+        self._file_records_path = self.download_path / "scraping_metadata.jsonl"
+        self._file_records = None
+        self._file_records_started = False
+        self._metadata_saved = False
+        
+        # Memoize detail-page lookups per instance - the same circular URL often
+        # appears on several listing pages, so repeat hits skip the HTTP fetch and parse.
+        # Failed fetches raise and lru_cache never stores exceptions, so they are retried
+        self._fetch_and_parse_page = lru_cache(maxsize=PAGE_CACHE_SIZE)(self._fetch_and_parse_page)
+        
+        log.info("🧩 Parsing HTML with BeautifulSoup's '%s' parser", HTML_PARSER)
+        
         # Initialize session with cookies (may need to visit main page first)
         self._initialize_session()
     
+    def _load_seen_urls(self) -> Dict[str, Path]:
+        """Load the PDF URL -> filename index written by previous runs."""
+        seen = {}
+        try:
+            if self._seen_urls_file.exists():
+                with open(self._seen_urls_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        pdf_url, _, filename = line.rstrip("\n").partition("\t")
+                        if pdf_url and filename:
+                            seen[pdf_url] = self.download_path / filename
+        except Exception as e:
+            log.warning("⚠️  Warning: Could not load seen URLs index: %s", e)
+        return seen
+    
+    def _remember_download(self, pdf_url: str, filepath: Path) -> None:
+        """Record a downloaded PDF in memory and in the on-disk seen URLs index."""
+        with self._seen_urls_lock:
+            if self._downloaded_pdfs.get(pdf_url) == filepath:
+                return
+            self._downloaded_pdfs[pdf_url] = filepath
+            try:
+                with open(self._seen_urls_file, "a", encoding="utf-8") as f:
+                    f.write(f"{pdf_url}\t{filepath.name}\n")
+            except Exception as e:
+                log.warning("   ⚠️  Warning: Could not update seen URLs index: %s", e)
+    
+    def _record_file(self, file_info: Dict[str, Any]) -> None:
+        """Append a downloaded file's info to the JSONL metadata record."""
+        try:
+            if self._file_records is None:
+                mode = "ab" if self._file_records_started else "wb"
+                self._file_records = open(self._file_records_path, mode, buffering=1 << 16)
+                self._file_records_started = True
+            self._file_records.write(dump_json_line(file_info))
+        except Exception as e:
+            log.warning("   ⚠️  Warning: Could not record file metadata: %s", e)
+    
+    def close(self) -> None:
+        """Flush the JSONL metadata record and release the HTTP session."""
+        if self._file_records is not None:
+            self._file_records.close()
+            self._file_records = None
+        self.session.close()
+    
     def _initialize_session(self):
         """Initialize session by visiting the main page to get cookies."""
         try:
-            print("🔧 Initializing session...")
+            log.info("🔧 Initializing session...")
             main_page_url = f"{self.base_url}/sebiweb/home/HomeAction.do?doListing=yes&sid=1&ssid=7&smid=0"
             resp = self.session.get(main_page_url, timeout=30)
             resp.raise_for_status()
-            print(f"✅ Session initialized with {len(self.session.cookies)} cookies")
+            log.info("✅ Session initialized with %s cookies", len(self.session.cookies))
         except Exception as e:
-            print(f"⚠️  Warning: Could not initialize session: {e}")
+            log.warning("⚠️  Warning: Could not initialize session: %s", e)
     
     def _extract_date_and_circular_info(self, url: str, html_content: str = None) -> Dict[str, str]:
         
@@ -91,7 +254,7 @@ class SEBIAjaxScraper:
             
             # If HTML content is provided, try to extract more detailed date information
             if html_content:
-                soup = BeautifulSoup(html_content, "html.parser")
+                soup = BeautifulSoup(html_content, HTML_PARSER)
                 
                 # Look for date patterns in the HTML content
                 # Common patterns: "dated August 14, 2025", "Date: 14/08/2025", etc.
@@ -113,16 +276,13 @@ class SEBIAjaxScraper:
                     result["sebi_circular_ref"] = sebi_circular_pattern.group(0)
                     
         except Exception as e:
-            print(f"   ⚠️  Warning: Could not extract date/circular info from {url}: {e}")
+            log.warning("   ⚠️  Warning: Could not extract date/circular info from %s: %s", url, e)
         
         return result
     
-    def _extract_date_from_table_cell(self, td_element) -> str:
+    def _extract_date_from_table_cell(self, cell_text: str) -> str:
        
         try:
-            # Get all text from the cell
-            cell_text = td_element.get_text(strip=True)
-            
             # Look for date patterns
             import re
             
@@ -156,7 +316,7 @@ class SEBIAjaxScraper:
                     results["links"], 
                     results["files"]
                 )
-                print(f"   🔧 Enhanced {len(enhanced_results['links'])} links with extracted information")
+                log.info("   🔧 Enhanced %s links with extracted information", len(enhanced_results['links']))
             
             # Add timestamp and additional metadata
             metadata = {
@@ -175,13 +335,16 @@ class SEBIAjaxScraper:
                 # Save to download folder
                 metadata_file = self.download_path / "output/scraping_metadata.json"
             
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            metadata_file.write_bytes(dump_json_bytes(metadata))
+            self._metadata_saved = True
+            if not self._file_records_started:
+                # Nothing was downloaded - don't leave the previous run's record behind
+                self._file_records_path.unlink(missing_ok=True)
             
-            print(f"💾 Metadata saved to: {metadata_file}")
+            log.info("💾 Metadata saved to: %s", metadata_file)
             
         except Exception as e:
-            print(f"⚠️  Warning: Could not save metadata JSON: {e}")
+            log.warning("⚠️  Warning: Could not save metadata JSON: %s", e)
     
     def get_page_data(self, page_number: int = 1) -> Optional[str]:
         
@@ -221,20 +384,21 @@ class SEBIAjaxScraper:
                 'doDirect': page_number - 1
             }
             
-            print(f"📡 Fetching page {page_number} via AJAX...")
+            log.info("📡 Fetching page %s via AJAX...", page_number)
             
+            self.rate_limiter.acquire()
             resp = self.session.post(self.ajax_url, data=post_data, timeout=30)
             resp.raise_for_status()
             
             if resp.text.strip():
-                print(f"✅ Successfully fetched page {page_number} ({len(resp.text)} chars)")
+                log.info("✅ Successfully fetched page %s (%s chars)", page_number, len(resp.text))
                 return resp.text
             else:
-                print(f"❌ Empty response for page {page_number}")
+                log.error("❌ Empty response for page %s", page_number)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error fetching page {page_number}: {e}")
+            log.error("❌ Error fetching page %s: %s", page_number, e)
             return None
     
     def extract_links_from_html(self, html_content: str, page_number: int) -> List[Dict[str, Any]]:
@@ -249,30 +413,31 @@ class SEBIAjaxScraper:
             List of link dictionaries
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             # Look for the table with id="sample_1" or any tables
             tables = soup.find_all("table")
             if not tables:
-                print(f"⚠️  No tables found in page {page_number} response")
+                log.warning("⚠️  No tables found in page %s response", page_number)
                 return []
             
-            print(f"📊 Found {len(tables)} table(s) in page {page_number}")
+            log.info("📊 Found %s table(s) in page %s", len(tables), page_number)
             
             links_found = []
             
             # Process all tables (not just sample_1 as it might not exist in AJAX response)
             for table_idx, table in enumerate(tables):
                 td_elements = table.find_all("td")
-                print(f"   Table {table_idx + 1}: {len(td_elements)} cells")
+                log.info("   Table %s: %s cells", table_idx + 1, len(td_elements))
                 
                 for td_idx, td in enumerate(td_elements):
-                    # Extract potential date from this cell
-                    cell_date = self._extract_date_from_table_cell(td)
-                    
                     links = td.find_all("a", href=True)
                     
                     if links:
+                        # Extract cell text once and reuse it for the date and preview
+                        cell_text = td.get_text(strip=True)
+                        cell_date = self._extract_date_from_table_cell(cell_text)
+                        
                         for link in links:
                             href = link["href"]
                             text = link.get_text(strip=True)
@@ -297,26 +462,80 @@ class SEBIAjaxScraper:
                                 "page": page_number,
                                 "table_index": table_idx,
                                 "td_index": td_idx,
-                                "cell_content": td.get_text(strip=True)[:100],
+                                "cell_content": cell_text[:100],
                                 **circular_info  # Include all circular information
                             }
                             
                             links_found.append(link_data)
             
-            print(f"🔗 Extracted {len(links_found)} links from page {page_number}")
+            log.info("🔗 Extracted %s links from page %s", len(links_found), page_number)
             return links_found
             
         except Exception as e:
-            print(f"❌ Error extracting links from page {page_number}: {e}")
+            log.error("❌ Error extracting links from page %s: %s", page_number, e)
             return []
     
+    def _fetch_and_parse_page(self, url: str) -> Tuple[Tuple[str, ...], Dict[str, Any]]:
+        """
+        Fetch a circular detail page once and run both extractors on the same parse.
+        
+        Memoized per instance, so the result must not be mutated - see fetch_and_parse.
+        
+        Args:
+            url: Circular detail page URL
+            
+        Returns:
+            Tuple of (PDF URLs found on the page, circular details)
+            
+        Raises:
+            requests.RequestException: If the page cannot be fetched
+        """
+        self.rate_limiter.acquire()
+        resp = self.session.get(url, timeout=30)
+        resp.raise_for_status()
+        soup = BeautifulSoup(resp.text, HTML_PARSER)
+        return tuple(self._find_pdfs_in_soup(soup, url)), self._extract_circular_details_from_soup(soup)
+    
+    def fetch_and_parse(self, url: str) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Fetch and parse a circular detail page, reusing earlier successful lookups.
+        
+        Args:
+            url: Circular detail page URL
+            
+        Returns:
+            Tuple of (PDF URLs found on the page, circular details). Both are fresh
+            copies the caller may modify; a failed fetch gives ([], empty details)
+            and is retried on the next call.
+        """
+        try:
+            pdf_urls, circular_details = self._fetch_and_parse_page(url)
+        except Exception as e:
+            log.warning("   ⚠️  Error fetching page: %s", e)
+            return [], self._empty_circular_details()
+        
+        return list(pdf_urls), dict(circular_details)
+    
     def find_pdfs_on_page(self, url: str) -> List[str]:
         """Find PDF links on a webpage, including those in iframe src attributes."""
+        return self.fetch_and_parse(url)[0]
+    
+    def extract_circular_details_from_page(self, url: str) -> Dict[str, Any]:
+        """Extract circular number, date and SEBI reference from a circular detail page."""
+        return self.fetch_and_parse(url)[1]
+    
+    @staticmethod
+    def _empty_circular_details() -> Dict[str, Any]:
+        return {
+            "page_circular_number": None,
+            "page_circular_date": None,
+            "sebi_circular_ref": None,
+            "has_iframe": False
+        }
+    
+    def _find_pdfs_in_soup(self, soup: BeautifulSoup, url: str) -> List[str]:
+        """Find PDF links in a parsed page, including those in iframe src attributes."""
         try:
-            resp = self.session.get(url, timeout=30)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-            
             pdf_urls = []
             
             # Method 1: Look for direct PDF links in <a> tags
@@ -326,15 +545,15 @@ class SEBIAjaxScraper:
                 if href.lower().endswith(".pdf"):
                     full_pdf_url = urljoin(url, href) if not href.startswith(("http://", "https://")) else href
                     pdf_urls.append(full_pdf_url)
-                    print(f"   📄 Found PDF link: {full_pdf_url}")
+                    log.info("   📄 Found PDF link: %s", full_pdf_url)
             
             # Method 2: Look for PDFs in iframe src attributes
             iframes = soup.find_all("iframe", src=True)
-            print(f"   🖼️  Found {len(iframes)} iframe(s) on the page")
+            log.info("   🖼️  Found %s iframe(s) on the page", len(iframes))
             
             for iframe in iframes:
                 src = iframe["src"]
-                print(f"   🔍 Checking iframe src: {src}")
+                log.info("   🔍 Checking iframe src: %s", src)
                 
                 # Check for SEBI-style iframe with file parameter
                 if "?file=" in src:
@@ -346,22 +565,22 @@ class SEBIAjaxScraper:
                         
                         if 'file' in query_params:
                             pdf_url = query_params['file'][0]
-                            print(f"   📄 Extracted PDF from iframe file parameter: {pdf_url}")
+                            log.info("   📄 Extracted PDF from iframe file parameter: %s", pdf_url)
                             pdf_urls.append(pdf_url)
                     except Exception as e:
-                        print(f"   ⚠️  Error parsing iframe src: {e}")
+                        log.warning("   ⚠️  Error parsing iframe src: %s", e)
                 
                 # Check if iframe src is a direct PDF
                 elif src.lower().endswith(".pdf"):
                     full_pdf_url = urljoin(url, src) if not src.startswith(("http://", "https://")) else src
                     pdf_urls.append(full_pdf_url)
-                    print(f"   📄 Found direct PDF in iframe: {full_pdf_url}")
+                    log.info("   📄 Found direct PDF in iframe: %s", full_pdf_url)
                 
                 # Also check if iframe src contains 'pdf' in the URL path
                 elif "pdf" in src.lower() or ".pdf" in src.lower():
                     full_pdf_url = urljoin(url, src) if not src.startswith(("http://", "https://")) else src
                     pdf_urls.append(full_pdf_url)
-                    print(f"   📄 Found potential PDF in iframe: {full_pdf_url}")
+                    log.info("   📄 Found potential PDF in iframe: %s", full_pdf_url)
             
             # Method 3: Look for embed and object tags
             for tag in soup.find_all(["embed", "object"]):
@@ -371,7 +590,7 @@ class SEBIAjaxScraper:
                     if src.lower().endswith(".pdf") or "pdf" in src.lower():
                         full_pdf_url = urljoin(url, src) if not src.startswith(("http://", "https://")) else src
                         pdf_urls.append(full_pdf_url)
-                        print(f"   📄 Found PDF in {tag.name}: {full_pdf_url}")
+                        log.info("   📄 Found PDF in %s: %s", tag.name, full_pdf_url)
             
             # Remove duplicates while preserving order
             unique_pdfs = []
@@ -384,22 +603,13 @@ class SEBIAjaxScraper:
             return unique_pdfs
             
         except Exception as e:
-            print(f"   ⚠️  Error scanning page for PDFs: {e}")
+            log.warning("   ⚠️  Error scanning page for PDFs: %s", e)
             return []
     
-    def extract_circular_details_from_page(self, url: str) -> Dict[str, str]:
+    def _extract_circular_details_from_soup(self, soup: BeautifulSoup) -> Dict[str, Any]:
         
         try:
-            resp = self.session.get(url, timeout=30)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-            
-            circular_details = {
-                "page_circular_number": None,
-                "page_circular_date": None,
-                "sebi_circular_ref": None,
-                "has_iframe": False
-            }
+            circular_details = self._empty_circular_details()
             
             # Check if page has iframe (indicator of PDF content)
             iframes = soup.find_all("iframe")
@@ -409,7 +619,7 @@ class SEBIAjaxScraper:
             target_div = soup.find("div", class_="m_section bottom_space2")
             
             if target_div:
-                print(f"   📋 Found target div 'm_section bottom_space2'")
+                log.info("   📋 Found target div 'm_section bottom_space2'")
                 div_text = target_div.get_text(strip=True)
                 
                 # Extract various patterns from the div text
@@ -436,39 +646,39 @@ class SEBIAjaxScraper:
                 
                 if sebi_ref_found:
                     circular_details["sebi_circular_ref"] = sebi_ref_found
-                    print(f"   📋 Found SEBI reference: {sebi_ref_found}")
+                    log.info("   📋 Found SEBI reference: %s", sebi_ref_found)
                 
                 # Pattern 2: Look for circular numbers (usually at the end)
                 circular_num_pattern = re.search(r'(?:Circular\s*(?:No\.?|Number)\s*:?\s*)?(\d+)', div_text, re.IGNORECASE)
                 if circular_num_pattern:
                     circular_details["page_circular_number"] = circular_num_pattern.group(1)
-                    print(f"   🔢 Found circular number: {circular_num_pattern.group(1)}")
+                    log.info("   🔢 Found circular number: %s", circular_num_pattern.group(1))
                 
                 # Pattern 3: Look for dates in various formats
                 # Format: "August 14, 2025" or "14 August 2025"
                 date_pattern1 = re.search(r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})', div_text)
                 if date_pattern1:
                     circular_details["page_circular_date"] = date_pattern1.group(1)
-                    print(f"   📅 Found date (format 1): {date_pattern1.group(1)}")
+                    log.info("   📅 Found date (format 1): %s", date_pattern1.group(1))
                 
                 # Format: "14/08/2025" or "14-08-2025" 
                 if not circular_details["page_circular_date"]:
                     date_pattern2 = re.search(r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})', div_text)
                     if date_pattern2:
                         circular_details["page_circular_date"] = date_pattern2.group(1)
-                        print(f"   📅 Found date (format 2): {date_pattern2.group(1)}")
+                        log.info("   📅 Found date (format 2): %s", date_pattern2.group(1))
                 
                 # Format: Look for "dated" followed by date
                 if not circular_details["page_circular_date"]:
                     dated_pattern = re.search(r'dated\s+([^,.\n]+)', div_text, re.IGNORECASE)
                     if dated_pattern:
                         circular_details["page_circular_date"] = dated_pattern.group(1).strip()
-                        print(f"   📅 Found date (dated format): {dated_pattern.group(1).strip()}")
+                        log.info("   📅 Found date (dated format): %s", dated_pattern.group(1).strip())
                 
-                print(f"   📄 Div content preview: {div_text[:200]}...")
+                log.info("   📄 Div content preview: %.200s...", div_text)
             else:
                 # If specific div not found, search the entire page content
-                print(f"   ⚠️  Specific div not found, searching entire page content")
+                log.warning("   ⚠️  Specific div not found, searching entire page content")
                 page_text = soup.get_text()
                 
                 import re
@@ -493,24 +703,24 @@ class SEBIAjaxScraper:
                 
                 if sebi_ref_found:
                     circular_details["sebi_circular_ref"] = sebi_ref_found
-                    print(f"   📋 Found SEBI reference in page: {sebi_ref_found}")
+                    log.info("   📋 Found SEBI reference in page: %s", sebi_ref_found)
                 
                 # Look for dates
                 date_pattern = re.search(r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})', page_text)
                 if date_pattern:
                     circular_details["page_circular_date"] = date_pattern.group(1)
-                    print(f"   📅 Found date in page: {date_pattern.group(1)}")
+                    log.info("   📅 Found date in page: %s", date_pattern.group(1))
             
             return circular_details
             
         except Exception as e:
-            print(f"   ⚠️  Error extracting circular details from page: {e}")
-            return {
-                "page_circular_number": None,
-                "page_circular_date": None,
-                "sebi_circular_ref": None,
-                "has_iframe": False
-            }
+            log.warning("   ⚠️  Error extracting circular details from page: %s", e)
+            return self._empty_circular_details()
+    
+    def _log_page_cache_stats(self) -> None:
+        """Log hit/miss counters for the memoized detail-page lookups."""
+        stats = self._fetch_and_parse_page.cache_info()
+        log.info("🗃️  Page cache: %s hits/%s misses", stats.hits, stats.misses)
     
     def _update_links_with_enhanced_info(self, links: List[Dict[str, Any]], downloaded_files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Update links with enhanced information from downloaded files."""
@@ -545,7 +755,7 @@ class SEBIAjaxScraper:
                 
                 if link_url in url_to_enhanced_info:
                     # Create updated link with enhanced info
-                    updated_link = {**link}  # Copy original link
+                    updated_link = link.copy()  # Copy original link
                     enhanced_info = url_to_enhanced_info[link_url]
                     
                     # Update with enhanced information
@@ -561,154 +771,243 @@ class SEBIAjaxScraper:
             return updated_links
             
         except Exception as e:
-            print(f"⚠️  Warning: Could not update links with enhanced info: {e}")
+            log.warning("⚠️  Warning: Could not update links with enhanced info: %s", e)
             return links  # Return original links if update fails
     
     def download_pdf(self, pdf_url: str, filename: str) -> Optional[Path]:
         """Download a PDF file."""
         try:
+            # Reuse a PDF already fetched from the same URL, even under another filename
+            known_path = self._downloaded_pdfs.get(pdf_url)
+            if known_path and known_path.exists() and known_path.stat().st_size > 0:
+                log.info("   ℹ️  Already downloaded from this URL: %s", known_path.name)
+                return known_path
+            
             filepath = self.download_path / filename
             
-            if filepath.exists():
-                print(f"   ℹ️  File already exists: {filepath.name}")
+            if filepath.exists() and filepath.stat().st_size > 0:
+                log.info("   ℹ️  File already exists: %s", filepath.name)
+                self._remember_download(pdf_url, filepath)
                 return filepath
             
-            print(f"   📥 Downloading: {filepath.name}")
-            resp = self.session.get(pdf_url, timeout=60)
-            resp.raise_for_status()
-            
-            # Check if the response is actually a PDF
-            content_type = resp.headers.get('content-type', '').lower()
-            if 'pdf' not in content_type and not pdf_url.lower().endswith('.pdf'):
-                # Check if content starts with PDF signature
-                if not resp.content.startswith(b'%PDF'):
-                    print(f"   ⚠️  Warning: Response doesn't appear to be a PDF (Content-Type: {content_type})")
+            log.info("   📥 Downloading: %s", filepath.name)
+            self.rate_limiter.acquire()
+            with self.session.get(pdf_url, timeout=60, stream=True) as resp:
+                resp.raise_for_status()
+                
+                # Size preflight from the response headers - nothing of the body
+                # has been read yet, so oversized PDFs cost no bandwidth
+                content_length = int(resp.headers.get('content-length') or 0)
+                if self.max_pdf_bytes and content_length > self.max_pdf_bytes:
+                    log.warning("   ⚠️  Skipping: %s bytes exceeds limit of %s bytes", content_length, self.max_pdf_bytes)
                     return None
+                
+                chunks = resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+                first_chunk = next(chunks, b"")
+                
+                # Check if the response is actually a PDF
+                content_type = resp.headers.get('content-type', '').lower()
+                if 'pdf' not in content_type and not pdf_url.lower().endswith('.pdf'):
+                    # Check if content starts with PDF signature
+                    if not first_chunk.startswith(b'%PDF'):
+                        log.warning("   ⚠️  Warning: Response doesn't appear to be a PDF (Content-Type: %s)", content_type)
+                        return None
+                
+                # Stream into a temporary file so an interrupted download never
+                # leaves a truncated PDF that later runs would treat as complete
+                partial_path = filepath.with_name(filepath.name + ".part")
+                total_bytes = len(first_chunk)
+                try:
+                    with open(partial_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                        f.write(first_chunk)
+                        for chunk in chunks:
+                            f.write(chunk)
+                            total_bytes += len(chunk)
+                            if self.max_pdf_bytes and total_bytes > self.max_pdf_bytes:
+                                log.warning("   ⚠️  Skipping: download exceeds limit of %s bytes", self.max_pdf_bytes)
+                                return None
+                    partial_path.replace(filepath)
+                    self._remember_download(pdf_url, filepath)
+                finally:
+                    if partial_path.exists():
+                        partial_path.unlink()
             
-            with open(filepath, "wb") as f:
-                f.write(resp.content)
-            
-            print(f"   ✅ Downloaded: {filepath.name} ({len(resp.content)} bytes)")
+            log.info("   ✅ Downloaded: %s (%s bytes)", filepath.name, total_bytes)
             return filepath
             
         except Exception as e:
-            print(f"   ❌ Download failed: {e}")
+            log.error("   ❌ Download failed: %s", e)
             return None
     
+    def _process_page_links(self, page_links: List[Dict[str, Any]], page_num: int) -> List[Dict[str, Any]]:
+        """
+        Download the PDFs behind each link of a listing page.
+        
+        Links are processed concurrently on a small thread pool - the shared
+        session pools connections and the rate limiter still paces every request.
+        
+        Args:
+            page_links: Links extracted from the listing page
+            page_num: Page number the links came from
+            
+        Returns:
+            List of file info dictionaries for the downloaded PDFs, in link order
+        """
+        downloaded_files = []
+        add_file = downloaded_files.append
+        n = len(page_links)
+        
+        with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+            futures = [
+                executor.submit(self._process_link, link_info, i, n, page_num)
+                for i, link_info in enumerate(page_links, 1)
+            ]
+            for future in futures:
+                for file_info in future.result():
+                    add_file(file_info)
+                    self._record_file(file_info)
+        
+        if self._file_records is not None:
+            self._file_records.flush()
+        
+        return downloaded_files
+    
+    def _process_link(self, link_info: Dict[str, Any], i: int, n: int, page_num: int) -> List[Dict[str, Any]]:
+        """
+        Download the PDFs behind a single listing link.
+        
+        Args:
+            link_info: Link extracted from the listing page
+            i: 1-based position of the link on the page
+            n: Number of links on the page
+            page_num: Page number the link came from
+            
+        Returns:
+            List of file info dictionaries for the downloaded PDFs
+        """
+        link_files = []
+        add_file = link_files.append
+        
+        url = link_info["url"]
+        text = link_info["text"]
+        
+        log.info("\n🔄 Processing link %s/%s: %.50s...", i, n, text)
+        log.info("   🌐 URL: %s", url)
+        
+        try:
+            # Sanitized link-text prefix shared by every filename for this link
+            text_slug = _FILENAME_SANITIZE_RE.sub('_', text[:20])
+
+            # Check if the link itself is a PDF
+            if url.lower().endswith(".pdf"):
+                log.info("   📄 Direct PDF link detected")
+                filename = f"page_{page_num}_direct_{i}_{text_slug}.pdf"
+                
+                pdf_path = self.download_pdf(url, filename)
+                if pdf_path:
+                    # Create enhanced file info with circular details
+                    file_info = {
+                        "file_path": str(pdf_path),
+                        "original_filename": pdf_path.name,
+                        "source_url": url,
+                        "source_page": page_num,
+                        "link_text": text,
+                        "file_size": _file_size(pdf_path),
+                    }
+                    file_info.update(link_info)  # Include all circular information
+                    add_file(file_info)
+            else:
+                # Scrape the page for PDF links
+                log.info("   🔍 Scraping page for PDFs and circular details...")
+                pdf_urls, page_circular_details = self.fetch_and_parse(url)
+                
+                if not pdf_urls:
+                    log.info("   ❌ No PDFs found on this page")
+                    return link_files
+                
+                # Merge page details with URL-based details
+                enhanced_link_info = link_info.copy()
+                
+                # Override with page-extracted details if available
+                if page_circular_details.get("page_circular_date"):
+                    enhanced_link_info["circular_date"] = page_circular_details["page_circular_date"]
+                if page_circular_details.get("sebi_circular_ref"):
+                    # Use the full SEBI reference as the primary circular number
+                    enhanced_link_info["circular_number"] = page_circular_details["sebi_circular_ref"]
+                    enhanced_link_info["sebi_circular_ref"] = page_circular_details["sebi_circular_ref"]
+                    enhanced_link_info["url_circular_id"] = enhanced_link_info.get("circular_number")  # Keep URL ID as fallback
+                elif page_circular_details.get("page_circular_number"):
+                    enhanced_link_info["page_circular_number"] = page_circular_details["page_circular_number"]
+                
+                enhanced_link_info["has_iframe"] = page_circular_details["has_iframe"]
+                
+                log.info("   ✅ Found %s PDF(s) on the page", len(pdf_urls))
+                for j, pdf_url in enumerate(pdf_urls):
+                    filename = f"page_{page_num}_{i}_{j+1}_{text_slug}.pdf"
+                    
+                    pdf_path = self.download_pdf(pdf_url, filename)
+                    if pdf_path:
+                        # Create enhanced file info with circular details
+                        file_info = {
+                            "file_path": str(pdf_path),
+                            "original_filename": pdf_path.name,
+                            "source_url": url,
+                            "pdf_url": pdf_url,
+                            "source_page": page_num,
+                            "link_text": text,
+                            "file_size": _file_size(pdf_path),
+                        }
+                        file_info.update(enhanced_link_info)  # Include all enhanced circular information
+                        add_file(file_info)
+            
+        except Exception as e:
+            log.error("   ❌ Error processing %s: %s", url, e)
+        
+        return link_files
+    
     def scrape_multiple_pages(self, max_pages: int = 10, start_page: int = 1) -> Dict[str, Any]:
         
-        print(f"🚀 Starting AJAX scraper for {max_pages} pages")
-        print(f"📁 Download folder: {self.download_path.absolute()}")
-        print(f"📡 AJAX endpoint: {self.ajax_url}")
+        log.info("🚀 Starting AJAX scraper for %s pages", max_pages)
+        log.info("📁 Download folder: %s", self.download_path.absolute())
+        log.info("📡 AJAX endpoint: %s", self.ajax_url)
         
         all_links = []
         downloaded_files = []
         failed_pages = []
+        add_links = all_links.extend
+        add_files = downloaded_files.extend
         
-        for page_num in range(start_page, start_page + max_pages):
-            print(f"\n{'='*20} PAGE {page_num} {'='*20}")
-            
-            # Get page data via AJAX
-            html_content = self.get_page_data(page_num)
-            
-            if not html_content:
-                failed_pages.append(page_num)
-                print(f"❌ Failed to get data for page {page_num}")
-                continue
-            
-            # Extract links from the HTML
-            page_links = self.extract_links_from_html(html_content, page_num)
+        # The listing pages are fetched concurrently (still paced by the rate
+        # limiter) and consumed in page order; once a page comes back empty the
+        # fetches that have not started yet are cancelled
+        page_numbers = range(start_page, start_page + max_pages)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.download_workers, max_pages))) as listing_pool:
+            page_fetches = [listing_pool.submit(self.get_page_data, page_num) for page_num in page_numbers]
             
-            if not page_links:
-                print(f"⚠️  No links found on page {page_num} - might be end of data")
-                break
-            
-            all_links.extend(page_links)
-            
-            # Process each link for PDFs
-            for i, link_info in enumerate(page_links, 1):
-                url = link_info["url"]
-                text = link_info["text"]
+            for page_num, page_fetch in zip(page_numbers, page_fetches):
+                log.info("\n==================== PAGE %s ====================", page_num)
                 
-                print(f"\n🔄 Processing link {i}/{len(page_links)}: {text[:50]}...")
-                print(f"   🌐 URL: {url}")
+                # Get page data via AJAX
+                html_content = page_fetch.result()
                 
-                try:
-                    # Check if the link itself is a PDF
-                    if url.lower().endswith(".pdf"):
-                        print("   📄 Direct PDF link detected")
-                        filename = f"page_{page_num}_direct_{i}_{text[:20]}.pdf"
-                        filename = re.sub(r'[^\w\-_.]', '_', filename)
-                        
-                        pdf_path = self.download_pdf(url, filename)
-                        if pdf_path:
-                            # Create enhanced file info with circular details
-                            file_info = {
-                                "file_path": str(pdf_path),
-                                "original_filename": filename,
-                                "source_url": url,
-                                "source_page": page_num,
-                                "link_text": text,
-                                "file_size": pdf_path.stat().st_size if pdf_path.exists() else 0,
-                                **link_info  # Include all circular information
-                            }
-                            downloaded_files.append(file_info)
-                    else:
-                        # Scrape the page for PDFs
-                        print("   🔍 Scraping page for PDFs...")
-                        pdf_urls = self.find_pdfs_on_page(url)
-                        
-                        # Extract detailed circular information from the page content
-                        print("   📋 Extracting circular details from page content...")
-                        page_circular_details = self.extract_circular_details_from_page(url)
-                        
-                        # Merge page details with URL-based details
-                        enhanced_link_info = {**link_info}
-                        
-                        # Override with page-extracted details if available
-                        if page_circular_details.get("page_circular_date"):
-                            enhanced_link_info["circular_date"] = page_circular_details["page_circular_date"]
-                        if page_circular_details.get("sebi_circular_ref"):
-                            # Use the full SEBI reference as the primary circular number
-                            enhanced_link_info["circular_number"] = page_circular_details["sebi_circular_ref"]
-                            enhanced_link_info["sebi_circular_ref"] = page_circular_details["sebi_circular_ref"]
-                            enhanced_link_info["url_circular_id"] = enhanced_link_info.get("circular_number")  # Keep URL ID as fallback
-                        elif page_circular_details.get("page_circular_number"):
-                            enhanced_link_info["page_circular_number"] = page_circular_details["page_circular_number"]
-                        
-                        enhanced_link_info["has_iframe"] = page_circular_details["has_iframe"]
-                        
-                        if pdf_urls:
-                            print(f"   ✅ Found {len(pdf_urls)} PDF(s) on the page")
-                            for j, pdf_url in enumerate(pdf_urls):
-                                filename = f"page_{page_num}_{i}_{j+1}_{text[:20]}.pdf"
-                                filename = re.sub(r'[^\w\-_.]', '_', filename)
-                                
-                                pdf_path = self.download_pdf(pdf_url, filename)
-                                if pdf_path:
-                                    # Create enhanced file info with circular details
-                                    file_info = {
-                                        "file_path": str(pdf_path),
-                                        "original_filename": filename,
-                                        "source_url": url,
-                                        "pdf_url": pdf_url,
-                                        "source_page": page_num,
-                                        "link_text": text,
-                                        "file_size": pdf_path.stat().st_size if pdf_path.exists() else 0,
-                                        **enhanced_link_info  # Include all enhanced circular information
-                                    }
-                                    downloaded_files.append(file_info)
-                        else:
-                            print("   ❌ No PDFs found on this page")
-                    
-                    # Be respectful to the server
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"   ❌ Error processing {url}: {e}")
+                if not html_content:
+                    failed_pages.append(page_num)
+                    log.warning("❌ Failed to get data for page %s", page_num)
+                    continue
+                
+                # Extract links from the HTML
+                page_links = self.extract_links_from_html(html_content, page_num)
+                
+                if not page_links:
+                    log.warning("⚠️  No links found on page %s - might be end of data", page_num)
+                    break
+                
+                add_links(page_links)
+                
+                # Process each link for PDFs
+                add_files(self._process_page_links(page_links, page_num))
             
-            # Small delay between pages
-            time.sleep(2)
+            listing_pool.shutdown(wait=False, cancel_futures=True)
         
         # Results summary
         results = {
@@ -725,20 +1024,21 @@ class SEBIAjaxScraper:
         # Save metadata JSON file
         self._save_metadata_json(results)
         
-        print("\n" + "="*60)
-        print("📊 AJAX SCRAPING SUMMARY")
-        print("="*60)
-        print(f"📄 Pages processed: {max_pages}")
-        print(f"❌ Failed pages: {len(failed_pages)}")
-        print(f"🔗 Total links found: {len(all_links)}")
-        print(f"📄 PDFs downloaded: {len(downloaded_files)}")
-        print(f"📁 Download location: {self.download_path.absolute()}")
+        log.info("\n" + "=" * 60)
+        log.info("📊 AJAX SCRAPING SUMMARY")
+        log.info("=" * 60)
+        log.info("📄 Pages processed: %s", max_pages)
+        log.info("❌ Failed pages: %s", len(failed_pages))
+        log.info("🔗 Total links found: %s", len(all_links))
+        log.info("📄 PDFs downloaded: %s", len(downloaded_files))
+        log.info("📁 Download location: %s", self.download_path.absolute())
+        self._log_page_cache_stats()
         
         if failed_pages:
-            print(f"\n⚠️  Failed pages: {failed_pages}")
+            log.warning("\n⚠️  Failed pages: %s", failed_pages)
         
-        if downloaded_files:
-            print(f"\n📚 Sample downloaded files:")
+        if downloaded_files and log.isEnabledFor(logging.INFO):
+            log.info("\n📚 Sample downloaded files:")
             for i, file_info in enumerate(downloaded_files[:5]):  # Show first 5
                 if isinstance(file_info, dict):
                     filename = file_info.get("original_filename", "unknown")
@@ -749,23 +1049,23 @@ class SEBIAjaxScraper:
                     date = file_info.get("circular_date", "N/A")
                     has_iframe = file_info.get("has_iframe", False)
                     iframe_indicator = "🖼️ " if has_iframe else ""
-                    print(f"   📖 {iframe_indicator}{filename}")
-                    print(f"       � Circular: {circular_no}")
-                    print(f"       📅 Date: {date}")
+                    log.info("   📖 %s%s", iframe_indicator, filename)
+                    log.info("       � Circular: %s", circular_no)
+                    log.info("       📅 Date: %s", date)
                 else:
-                    print(f"   📖 {file_info}")  # Fallback for old format
+                    log.info("   📖 %s", file_info)  # Fallback for old format
             if len(downloaded_files) > 5:
-                print(f"   ... and {len(downloaded_files) - 5} more files")
-        else:
-            print("\n⚠️  No PDFs were downloaded")
+                log.info("   ... and %s more files", len(downloaded_files) - 5)
+        elif not downloaded_files:
+            log.warning("\n⚠️  No PDFs were downloaded")
         
         return results
     
     def scrape_single_page(self, page_number: int, save_metadata: bool = True) -> Dict[str, Any]:
         
-        print(f"🎯 Scraping single page: {page_number}")
-        print(f"📁 Download folder: {self.download_path.absolute()}")
-        print(f"📡 AJAX endpoint: {self.ajax_url}")
+        log.info("🎯 Scraping single page: %s", page_number)
+        log.info("📁 Download folder: %s", self.download_path.absolute())
+        log.info("📡 AJAX endpoint: %s", self.ajax_url)
         
         # Get page data via AJAX
         html_content = self.get_page_data(page_number)
@@ -793,91 +1093,10 @@ class SEBIAjaxScraper:
                 "files": []
             }
         
-        print(f"🔗 Found {len(page_links)} links on page {page_number}")
-        
-        downloaded_files = []
+        log.info("🔗 Found %s links on page %s", len(page_links), page_number)
         
         # Process each link for PDFs
-        for i, link_info in enumerate(page_links, 1):
-            url = link_info["url"]
-            text = link_info["text"]
-            
-            print(f"\n🔄 Processing link {i}/{len(page_links)}: {text[:50]}...")
-            print(f"   🌐 URL: {url}")
-            
-            try:
-                # Check if the link itself is a PDF
-                if url.lower().endswith(".pdf"):
-                    print("   📄 Direct PDF link detected")
-                    filename = f"page_{page_number}_direct_{i}_{text[:20]}.pdf"
-                    filename = re.sub(r'[^\w\-_.]', '_', filename)
-                    
-                    pdf_path = self.download_pdf(url, filename)
-                    if pdf_path:
-                        # Create enhanced file info with circular details
-                        file_info = {
-                            "file_path": str(pdf_path),
-                            "original_filename": filename,
-                            "source_url": url,
-                            "source_page": page_number,
-                            "link_text": text,
-                            "file_size": pdf_path.stat().st_size if pdf_path.exists() else 0,
-                            **link_info  # Include all circular information
-                        }
-                        downloaded_files.append(file_info)
-                else:
-                    # Scrape the page for PDF links
-                    print("   🔍 Scraping page for PDFs...")
-                    pdf_urls = self.find_pdfs_on_page(url)
-                    
-                    # Extract detailed circular information from the page content
-                    print("   📋 Extracting circular details from page content...")
-                    page_circular_details = self.extract_circular_details_from_page(url)
-                    
-                    # Merge page details with URL-based details
-                    enhanced_link_info = {**link_info}
-                    
-                    # Override with page-extracted details if available
-                    if page_circular_details.get("page_circular_date"):
-                        enhanced_link_info["circular_date"] = page_circular_details["page_circular_date"]
-                    if page_circular_details.get("sebi_circular_ref"):
-                        # Use the full SEBI reference as the primary circular number
-                        enhanced_link_info["circular_number"] = page_circular_details["sebi_circular_ref"]
-                        enhanced_link_info["sebi_circular_ref"] = page_circular_details["sebi_circular_ref"]
-                        enhanced_link_info["url_circular_id"] = enhanced_link_info.get("circular_number")  # Keep URL ID as fallback
-                    elif page_circular_details.get("page_circular_number"):
-                        enhanced_link_info["page_circular_number"] = page_circular_details["page_circular_number"]
-                    
-                    enhanced_link_info["has_iframe"] = page_circular_details["has_iframe"]
-                    
-                    if pdf_urls:
-                        print(f"   ✅ Found {len(pdf_urls)} PDF(s) on the page")
-                        for j, pdf_url in enumerate(pdf_urls):
-                            filename = f"page_{page_number}_{i}_{j+1}_{text[:20]}.pdf"
-                            filename = re.sub(r'[^\w\-_.]', '_', filename)
-                            
-                            pdf_path = self.download_pdf(pdf_url, filename)
-                            if pdf_path:
-                                # Create enhanced file info with circular details
-                                file_info = {
-                                    "file_path": str(pdf_path),
-                                    "original_filename": filename,
-                                    "source_url": url,
-                                    "pdf_url": pdf_url,
-                                    "source_page": page_number,
-                                    "link_text": text,
-                                    "file_size": pdf_path.stat().st_size if pdf_path.exists() else 0,
-                                    **enhanced_link_info  # Include all enhanced circular information
-                                }
-                                downloaded_files.append(file_info)
-                    else:
-                        print("   ❌ No PDFs found on this page")
-                
-                # Be respectful to the server
-                time.sleep(1)
-                
-            except Exception as e:
-                print(f"   ❌ Error processing {url}: {e}")
+        downloaded_files = self._process_page_links(page_links, page_number)
         
         # Results summary
         results = {
@@ -895,12 +1114,12 @@ class SEBIAjaxScraper:
         if save_metadata:
             self._save_metadata_json(results)
         
-        print(f"\n📊 PAGE {page_number} SUMMARY:")
-        print(f"🔗 Links found: {len(page_links)}")
-        print(f"📄 PDFs downloaded: {len(downloaded_files)}")
+        log.info("\n📊 PAGE %s SUMMARY:", page_number)
+        log.info("🔗 Links found: %s", len(page_links))
+        log.info("📄 PDFs downloaded: %s", len(downloaded_files))
         
-        if downloaded_files:
-            print(f"📚 Downloaded files:")
+        if downloaded_files and log.isEnabledFor(logging.INFO):
+            log.info("📚 Downloaded files:")
             for file_info in downloaded_files:
                 if isinstance(file_info, dict):
                     filename = file_info.get("original_filename", "unknown")
@@ -911,26 +1130,29 @@ class SEBIAjaxScraper:
                     date = file_info.get("circular_date", "N/A")
                     has_iframe = file_info.get("has_iframe", False)
                     iframe_indicator = "🖼️ " if has_iframe else ""
-                    print(f"   📖 {iframe_indicator}{filename}")
-                    print(f"       � Circular: {circular_no}")
-                    print(f"       📅 Date: {date}")
+                    log.info("   📖 %s%s", iframe_indicator, filename)
+                    log.info("       � Circular: %s", circular_no)
+                    log.info("       📅 Date: %s", date)
                 else:
-                    print(f"   📖 {file_info}")  # Fallback for old format
+                    log.info("   📖 %s", file_info)  # Fallback for old format
         
         return results
     
     def scrape_specific_pages(self, page_numbers: List[int]) -> Dict[str, Any]:
         
-        print(f"🎯 Scraping specific pages: {page_numbers}")
-        print(f"📁 Download folder: {self.download_path.absolute()}")
+        log.info("🎯 Scraping specific pages: %s", page_numbers)
+        log.info("📁 Download folder: %s", self.download_path.absolute())
         
         all_results = []
         all_links = []
         all_downloaded_files = []
+        # File path column kept alongside the file records instead of being
+        # re-derived from them (twice) when the results are assembled
+        all_file_paths = []
         failed_pages = []
         
         for page_num in page_numbers:
-            print(f"\n{'='*20} PAGE {page_num} {'='*20}")
+            log.info("\n==================== PAGE %s ====================", page_num)
             
             try:
                 page_result = self.scrape_single_page(page_num, save_metadata=False)
@@ -943,21 +1165,25 @@ class SEBIAjaxScraper:
                     if isinstance(page_files, list) and page_files:
                         if isinstance(page_files[0], dict):
                             all_downloaded_files.extend(page_files)
+                            all_file_paths.extend(page_result.get("file_paths") or [f["file_path"] for f in page_files])
                         else:
                             # Convert old format to new format for consistency
                             for file_path in page_files:
                                 all_downloaded_files.append({"file_path": str(file_path)})
+                                all_file_paths.append(str(file_path))
                 else:
                     failed_pages.append(page_num)
                     
             except Exception as e:
-                print(f"❌ Error scraping page {page_num}: {e}")
+                log.error("❌ Error scraping page %s: %s", page_num, e)
                 failed_pages.append(page_num)
         
+        pages_processed = sum(1 for r in all_results if r["success"])
+        
         # Combined results - formatted for both single and multiple page compatibility
         combined_results = {
             "pages_requested": page_numbers,
-            "pages_processed": len([r for r in all_results if r["success"]]),
+            "pages_processed": pages_processed,
             "failed_pages": failed_pages,
             "total_links": len(all_links),
             "total_downloaded_files": len(all_downloaded_files),
@@ -966,7 +1192,7 @@ class SEBIAjaxScraper:
             # Main data structures for compatibility with existing API
             "links": all_links,  # All links from all pages combined
             "files": all_downloaded_files,  # All files from all pages combined
-            "file_paths": [f["file_path"] if isinstance(f, dict) else str(f) for f in all_downloaded_files],  # Backward compatibility
+            "file_paths": all_file_paths,  # Backward compatibility
             
             # Detailed page-by-page results
             "page_results": all_results,
@@ -974,21 +1200,22 @@ class SEBIAjaxScraper:
             # Legacy aliases for backward compatibility
             "all_links": all_links,
             "all_files": all_downloaded_files,
-            "all_file_paths": [f["file_path"] if isinstance(f, dict) else str(f) for f in all_downloaded_files]
+            "all_file_paths": all_file_paths
         }
         
         # Save metadata JSON file
         self._save_metadata_json(combined_results)
         
-        print("\n" + "="*60)
-        print("📊 SPECIFIC PAGES SCRAPING SUMMARY")
-        print("="*60)
-        print(f"📄 Pages requested: {page_numbers}")
-        print(f"✅ Pages successfully processed: {len([r for r in all_results if r['success']])}")
-        print(f"❌ Failed pages: {failed_pages}")
-        print(f"🔗 Total links found: {len(all_links)}")
-        print(f"📄 Total PDFs downloaded: {len(all_downloaded_files)}")
-        print(f"📁 Download location: {self.download_path.absolute()}")
+        log.info("\n" + "=" * 60)
+        log.info("📊 SPECIFIC PAGES SCRAPING SUMMARY")
+        log.info("=" * 60)
+        log.info("📄 Pages requested: %s", page_numbers)
+        log.info("✅ Pages successfully processed: %s", pages_processed)
+        log.info("❌ Failed pages: %s", failed_pages)
+        log.info("🔗 Total links found: %s", len(all_links))
+        log.info("📄 Total PDFs downloaded: %s", len(all_downloaded_files))
+        log.info("📁 Download location: %s", self.download_path.absolute())
+        self._log_page_cache_stats()
         
         return combined_results
 
@@ -1006,13 +1233,15 @@ def scrape_page(page_numbers, download_folder: str = "sebi_single_page") -> Dict
     else:
         raise ValueError("page_numbers must be either an int or a list of ints")
     
-    # Ensure metadata is saved for dynamic function calls too
+    # Ensure metadata is saved for dynamic function calls too - the scrape
+    # methods normally write it already, so only save when they did not
     try:
-        metadata_file = Path(download_folder) / "output/scraping_metadata.json"
-        if not metadata_file.exists():
+        if not scraper._metadata_saved:
             scraper._save_metadata_json(results)
     except Exception as e:
         print(f"⚠️  Note: Metadata may not have been saved: {e}")
+    finally:
+        scraper.close()
     
     return results
 
@@ -1022,25 +1251,30 @@ def scrape_pages(page_numbers: List[int], download_folder: str = "sebi_multiple_
     scraper = SEBIAjaxScraper(download_folder=download_folder)
     results = scraper.scrape_specific_pages(page_numbers)
     
-    # Ensure metadata is saved for dynamic function calls too
+    # Ensure metadata is saved for dynamic function calls too - the scrape
+    # methods normally write it already, so only save when they did not
     try:
-        metadata_file = Path(download_folder) / "output/scraping_metadata.json"
-        if not metadata_file.exists():
+        if not scraper._metadata_saved:
             scraper._save_metadata_json(results)
     except Exception as e:
         print(f"⚠️  Note: Metadata may not have been saved: {e}")
+    finally:
+        scraper.close()
     
     return results
 
 def get_page_links_only(page_number: int) -> List[Dict[str, Any]]:
     
     scraper = SEBIAjaxScraper(download_folder="temp_links_only")
-    html_content = scraper.get_page_data(page_number)
-    
-    if html_content:
-        return scraper.extract_links_from_html(html_content, page_number)
-    else:
-        return []
+    try:
+        html_content = scraper.get_page_data(page_number)
+        
+        if html_content:
+            return scraper.extract_links_from_html(html_content, page_number)
+        else:
+            return []
+    finally:
+        scraper.close()
 
 def main():
     """Main function for testing the AJAX scraper."""
@@ -1057,13 +1291,15 @@ def main():
     # Create scraper and run
     scraper = SEBIAjaxScraper(download_folder=folder)
     results = scraper.scrape_multiple_pages(max_pages=max_pages)
+    scraper.close()
     
     # Save results to JSON
     results_file = Path(folder) / "scraping_results.json"
-    with open(results_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    results_file.write_bytes(dump_json_bytes(results))
     
     print(f"\n📄 Results saved to: {results_file}")
 
+# Run from the repository root so the tool package is importable:
+#   python -m tool.webScrapper.ajax_scraper
 if __name__ == "__main__":
     main()
@@ -4,27 +4,566 @@ Workflow Visualization and Documentation Generator
 This module provides utilities to visualize and document the LangGraph workflow
 """
 
-import json
-from typing import Dict, Any, List
-from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import os
+import sys
+import copy
+from math import hypot, sqrt
+import hashlib
+import zipfile
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from dataclasses import dataclass
+from typing import Final, Optional, Tuple, get_type_hints
+
+from workflow_types import WorkflowState
+
+# Probe for matplotlib once without importing it - the import itself is deferred
+# to generate_workflow_diagram so that only diagram rendering pays for it
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+
+from tool.jsonSerializer.index import dump_json_bytes
+
+
+# Rendered diagram (one file per output format) and the sidecar holding the hash
+# of the source it was rendered from
+DIAGRAM_BASENAME = 'sebi_langgraph_workflow_diagram'
+DIAGRAM_HASH_SUFFIX = '.hash'
+
+# Default and high-resolution output DPI for the rendered diagram
+DIAGRAM_DPI = 150
+DIAGRAM_HIRES_DPI = 300
+
+# Serialized node/state structure written by generate_state_flow_json
+STATE_FLOW_JSON_FILE = 'langgraph_workflow_structure.json'
+
+# Diagram palette
+_DIAGRAM_COLORS = {
+    'start_end': '#4CAF50',
+    'agent': '#2196F3',
+    'decision': '#FF9800',
+    'finalize': '#9C27B0',
+    'data': '#607D8B',
+    'success_path': '#4CAF50',
+    'error_path': '#f44336',
+    'data_flow': '#9E9E9E'
+}
+
+# Node footprints (width, height) for accurate arrow connection points
+_NODE_SIZES = {
+    'circle': (1.0, 1.0),      # START/END nodes
+    'agent': (3.0, 1.6),       # Agent rectangles
+    'decision': (2.0, 2.0),    # Decision diamonds
+    'data': (1.4, 1.0)         # Data storage nodes
+}
+
+# Side of the square decision nodes - the same shape as the 4-vertex
+# RegularPolygon of radius 1 at orientation pi/4 they used to be drawn as
+_DECISION_SIDE = sqrt(2)
+
+# Matplotlib settings applied while the diagram is built and saved
+_DIAGRAM_RC_PARAMS = {'path.simplify': True, 'path.simplify_threshold': 1.0}
+
+# Axes placement inside the 20x14 in figure - the margins tight_layout() computes
+# for this diagram (its default 1.08 * 10pt pad), fixed by hand so no layout pass runs
+_DIAGRAM_SUBPLOT_PARAMS = {'left': 0.0075, 'right': 0.9925, 'bottom': 0.0107, 'top': 0.9893}
+
+# Box styles for the agent/finalize nodes and the data nodes
+_AGENT_BOXSTYLE = "round,pad=0.15"
+_DATA_BOXSTYLE = "round,pad=0.1"
+
+# Text styles for node labels, bound once and shared by every label of that kind
+_NODE_TEXT_STYLES = {
+    'terminal': {'ha': 'center', 'va': 'center', 'fontweight': 'bold', 'color': 'white', 'fontsize': 14},
+    'title': {'ha': 'center', 'va': 'center', 'fontweight': 'bold', 'color': 'white', 'fontsize': 12},
+    'bullets': {'ha': 'center', 'va': 'center', 'color': 'white', 'fontsize': 9},
+    'decision': {'ha': 'center', 'va': 'center', 'fontweight': 'bold', 'color': 'white', 'fontsize': 11},
+    'data': {'ha': 'center', 'va': 'center', 'fontweight': 'bold', 'color': 'white', 'fontsize': 10},
+}
+
+@dataclass(frozen=True)
+class ArrowSpec:
+    """One arrow of the workflow diagram; attributes left out take these defaults"""
+    start: Tuple[float, float]
+    end: Tuple[float, float]
+    label: str
+    color: str
+    curve: bool = False
+    style: str = 'solid'
+    weight: str = 'medium'
+    start_type: Optional[str] = None
+    end_type: Optional[str] = None
+    curve_direction: Optional[str] = None
+
+
+# Arrow line styling: weight -> (linewidth, alpha, head_width), style -> linestyle,
+# and curve direction -> arc3 radius (other directions use 0.25)
+_ARROW_WEIGHTS = {
+    'heavy': (4, 0.95, 0.8),
+    'medium': (3, 0.8, 0.6),
+    'light': (2, 0.6, 0.4),
+}
+_ARROW_LINESTYLES = {'solid': '-', 'dashed': '--', 'dotted': ':'}
+_CURVE_RADII = {'down-left': -0.3, 'up-right': 0.3, 'right': 0.2}
+
+# Arrow label styling per arrow weight: (bbox template, fontsize, fontweight).
+# The bbox edge color is filled in per arrow; light (data flow) labels have no box
+_LABEL_STYLES = {
+    'heavy': ({'boxstyle': 'round,pad=0.3', 'facecolor': 'white', 'alpha': 0.95, 'linewidth': 2}, 10, 'bold'),
+    'medium': ({'boxstyle': 'round,pad=0.3', 'facecolor': '#f9f9f9', 'alpha': 0.9, 'linewidth': 1.5}, 9, 'semibold'),
+    'light': (None, 8, 'normal'),
+}
+
+# Text fallback for the workflow diagram, used when matplotlib is unavailable
+ASCII_WORKFLOW_DIAGRAM_FILE = 'sebi_workflow_ascii_diagram.txt'
+_ASCII_WORKFLOW_DIAGRAM_LINES: Final[Tuple[str, ...]] = (
+    '┌─────────────────────────────────────────────────────────────────────────────────────────┐',
+    '│                      LangGraph SEBI Document Processing Workflow                         │',
+    '│                             Multi-Agent System Architecture                              │',
+    '└─────────────────────────────────────────────────────────────────────────────────────────┘',
+    '',
+    '',
+    '     ┌─────────────┐',
+    '     │    START    │',
+    '     └──────┬──────┘',
+    '            │',
+    '            │ Initialize Workflow',
+    '            │',
+    '            ▼',
+    '┌─────────────────────────────┐              ┌─────────────────────┐',
+    '│       Web Scraping          │◄─────────────│     SEBI Website    │',
+    '│         Agent               │              │    (Data Source)    │',
+    '│                             │              └─────────────────────┘',
+    '│  • Download PDF files       │',
+    '│  • Extract document links   │',
+    '│  • Collect metadata         │',
+    '│  • Session management       │',
+    '└─────────────┬───────────────┘',
+    '              │',
+    '              │ Validate Downloaded Files',
+    '              │',
+    '              ▼',
+    '        ┌─────────────────┐',
+    '        │  Files Present  │',
+    '        │  & Accessible?  │ ◄──── Decision Point 1',
+    '        └─────┬─────┬─────┘',
+    '              │     │',
+    '     SUCCESS  │     │  NO FILES',
+    '              │     └─────────────────┐',
+    '              ▼                       │',
+    '┌─────────────────────────────┐       │              ┌─────────────────────┐',
+    '│    Document Processing      │       │              │     PDF Files       │',
+    '│         Agent               │◄──────┼──────────────│   (File System)     │',
+    '│                             │       │              └─────────────────────┘',
+    '│  • Extract text content     │       │',
+    '│  • Parse document metadata  │       │',
+    '│  • Validate content format  │       │',
+    '│  • Handle extraction errors │       │',
+    '└─────────────┬───────────────┘       │',
+    '              │                       │',
+    '              │ Validate Extracted Text│',
+    '              │                       │',
+    '              ▼                       │',
+    '        ┌─────────────────┐           │',
+    '        │  Text Content   │           │',
+    '        │   Available?    │ ◄──── Decision Point 2',
+    '        └─────┬─────┬─────┘           │',
+    '              │     │                 │',
+    '     SUCCESS  │     │  NO TEXT        │',
+    '              │     └─────────────────┤',
+    '              ▼                       │',
+    '┌─────────────────────────────┐       │',
+    '│       Analysis              │       │',
+    '│        Agent                │       │',
+    '│                             │       │',
+    '│  • LLM-based classification │       │',
+    '│  • Department identification │       │',
+    '│  • Extract key insights     │       │',
+    '│  • Generate structured data │       │',
+    '└─────────────┬───────────────┘       │',
+    '              │                       │',
+    '              │ Analysis Complete     │',
+    '              │                       │',
+    '              ▼                       │',
+    '┌─────────────────────────────┐       │',
+    '│      Finalize &             │ ◄─────┘',
+    '│       Report                │',
+    '│                             │',
+    '│  • Aggregate all results    │',
+    '│  • Generate final reports   │',
+    '│  • Save output files        │',
+    '│  • Perform cleanup          │',
+    '│  • Log workflow statistics  │',
+    '└─────────────┬───────────────┘',
+    '              │',
+    '              │ Workflow Complete',
+    '              │',
+    '              ▼',
+    '        ┌─────────────┐',
+    '        │     END     │',
+    '        └─────────────┘',
+    '',
+    '',
+    '┌─────────────────────────────────────────────────────────────────────────────────────────┐',
+    '│                                  State Management                                        │',
+    '├─────────────────────────────────────────────────────────────────────────────────────────┤',
+    '│  Input Parameters:                                                                      │',
+    '│    • page_numbers: List[int]     - SEBI website pages to process                       │',
+    '│    • download_folder: str        - Target directory for downloaded files               │',
+    '│                                                                                         │',
+    '│  Workflow Results:                                                                      │',
+    '│    • scraping_result: Dict       - Download statistics and file metadata               │',
+    '│    • processing_result: Dict     - Text extraction results and document info           │',
+    '│    • analysis_result: Dict       - LLM classification and insights                     │',
+    '│                                                                                         │',
+    '│  Workflow Metadata:                                                                     │',
+    '│    • current_stage: str          - Active processing stage                             │',
+    '│    • workflow_id: str            - Unique workflow execution identifier                │',
+    '│    • start_time: str             - Workflow initialization timestamp                   │',
+    '│    • errors: List[str]           - Comprehensive error collection                      │',
+    '│    • messages: List[Dict]        - Inter-agent communication log                      │',
+    '└─────────────────────────────────────────────────────────────────────────────────────────┘',
+    '',
+    '',
+    '┌─────────────────────────────────────────────────────────────────────────────────────────┐',
+    '│                                 Execution Paths                                          │',
+    '├─────────────────────────────────────────────────────────────────────────────────────────┤',
+    '│  Success Path (All stages complete):                                                   │',
+    '│    START → Web Scraping → Files Check → Doc Processing → Text Check → Analysis → END  │',
+    '│                                                                                         │',
+    '│  No Files Path (Scraping fails):                                                       │',
+    '│    START → Web Scraping → Files Check → Finalize → END                                │',
+    '│                                                                                         │',
+    '│  No Text Path (Processing fails):                                                      │',
+    '│    START → Web Scraping → Files Check → Doc Processing → Text Check → Finalize → END  │',
+    '│                                                                                         │',
+    '│  Error Handling: Graceful degradation with comprehensive error logging                 │',
+    '└─────────────────────────────────────────────────────────────────────────────────────────┘',
+    '',
+    '',
+    '┌─────────────────────────────────────────────────────────────────────────────────────────┐',
+    '│                                   Output Files                                           │',
+    '├─────────────────────────────────────────────────────────────────────────────────────────┤',
+    '│  Primary Outputs:                                                                       │',
+    '│    📄 scraping_metadata.json              - Raw scraping data and download statistics   │',
+    '│    🔍 sebi_document_analysis_results.json - LLM analysis results and classifications    │',
+    '│                                                                                         │',
+    '│  Optional Outputs:                                                                      │',
+    '│    📊 workflow_results_[ID].json          - Complete workflow execution results         │',
+    '│    📈 workflow_statistics.json            - Performance metrics and timing data        │',
+    '│                                                                                         │',
+    '│  File Formats: UTF-8 JSON (written with orjson when installed), programmatic access     │',
+    '└─────────────────────────────────────────────────────────────────────────────────────────┘',
+)
+ASCII_WORKFLOW_DIAGRAM: Final[str] = '\n'.join(_ASCII_WORKFLOW_DIAGRAM_LINES) + '\n'
+_ASCII_WORKFLOW_DIAGRAM_BYTES: Final[bytes] = ASCII_WORKFLOW_DIAGRAM.encode('utf-8')
+
+# Markdown documentation written by generate_workflow_documentation
+WORKFLOW_DOCUMENTATION_FILE = 'workflow_documentation.md'
+WORKFLOW_DOCUMENTATION_MD: Final[str] = """
+# SEBI Document Processing Multi-Agent Workflow
+
+## Overview
+This LangGraph-based multi-agent system processes SEBI (Securities and Exchange Board of India) documents through a structured workflow with three specialized agents.
+
+## Architecture
+
+### Agents
+
+#### 1. Web Scraping Agent
+- **Purpose**: Downloads PDFs from SEBI website using AJAX scraper
+- **Input**: Page numbers, download folder
+- **Output**: Downloaded PDF files and metadata
+- **Technology**: Custom AJAX scraper with session management
+
+#### 2. Document Processing Agent  
+- **Purpose**: Extracts text and metadata from PDF documents
+- **Input**: Downloaded PDF files
+- **Output**: Extracted text content and document metadata
+- **Technology**: PyMuPDF when installed (pdfplumber re-reads pages where it finds little text), with PyPDF2 and pdfplumber as the fallback
+
+#### 3. Analysis Agent
+- **Purpose**: Analyzes and classifies documents using LLM
+- **Input**: Extracted text content
+- **Output**: Classified documents with departments, intermediaries, and key insights
+- **Technology**: PWC GenAI API with structured prompts
+
+### Workflow Flow
+
+```
+START → Web Scraping → [Files Downloaded?] → Document Processing → [Text Extracted?] → Analysis → Finalize → END
+           ↓                                        ↓
+        [No Files]                              [No Text]
+           ↓                                        ↓
+        Finalize ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ←
+```
+
+## State Management
+
+The workflow uses a shared state object that includes:
+- Input parameters (page numbers, download folder)
+- Results from each stage
+- Workflow metadata and error tracking
+- Inter-agent messages
+
+## Key Features
+
+### 1. Error Resilience
+- Each agent handles errors gracefully
+- Workflow continues even if individual stages fail
+- Comprehensive error logging and reporting
+
+### 2. Conditional Execution
+- Decisions points check if previous stages succeeded
+- Workflow can skip stages if prerequisites aren't met
+- Smart routing based on intermediate results
+
+### 3. Comprehensive Logging
+- Each agent logs its activities with timestamps
+- Inter-agent messages track workflow progress
+- Final report summarizes entire workflow
+
+### 4. State Persistence
+- LangGraph checkpointer maintains workflow state
+- Enables workflow resumption and debugging
+- Complete audit trail of all operations
+
+## Usage Examples
+
+### Basic Usage
+```python
+from langgraph_workflow import run_sebi_workflow
+
+# Run with default parameters
+result = run_sebi_workflow([1, 2], "test_enhanced_metadata")
+```
+
+### Custom Workflow
+```python
+from langgraph_workflow import WorkflowOrchestrator
+
+orchestrator = WorkflowOrchestrator()
+result = orchestrator.run_workflow([1, 3, 5], "custom_folder")
+```
+
+### Original Sequential Comparison
+```python
+# Original approach (sequential)
+result = scrape_page([1,2], "test_enhanced_metadata")
+result = process_test_enhanced_metadata_pdfs()
+result = run_analysis()
+
+# New approach (multi-agent workflow)
+result = run_sebi_workflow([1,2], "test_enhanced_metadata")
+```
+
+## Output Files
+
+### Generated Files
+1. **scraping_metadata.json** - Raw scraping data and file metadata
+2. **sebi_document_analysis_results.json** - LLM analysis results
+3. **sebi_document_analysis_results.jsonl** - Per-document analyses appended (one JSON object per line) as each batch completes; the JSON file above is the aggregate written at the end
+4. **workflow_results_[ID].json** - Complete workflow execution results
+
+### Metadata Structure
+Each file processed includes:
+- Circular number and date extraction
+- SEBI reference identification  
+- Department classification
+- Intermediary identification
+- Key clauses and metrics
+- Actionable items
+
+## Benefits Over Sequential Approach
+
+### 1. Better Error Handling
+- Individual stage failures don't crash entire process
+- Graceful degradation and recovery mechanisms
+- Detailed error reporting and diagnostics
+
+### 2. Improved Observability
+- Real-time progress tracking
+- Inter-agent communication logging
+- Performance metrics and timing
+
+### 3. Enhanced Maintainability
+- Modular agent architecture
+- Clear separation of concerns
+- Easy to extend with new agents
+
+### 4. Workflow Flexibility
+- Conditional execution paths
+- Configurable parameters
+- Multiple workflow patterns supported
+
+## Configuration
+
+### Environment Variables
+- API keys for PWC GenAI service
+- Custom download paths
+- Model selection preferences
+- `LLM_CACHE_PATH`: SQLite file for the exact-match LLM response cache (default `.llm_cache.sqlite`, empty to disable)
+- `EXTRACTION_CACHE_PATH`: manifest of extracted PDF text keyed by content hash (default `.cache/processed.json`, empty to disable)
+
+### Workflow Parameters
+- Page numbers to scrape
+- Download folder names
+- Processing options
+- Analysis model selection
+
+## Monitoring and Debugging
+
+### Logging Levels
+- INFO: Normal operation messages
+- ERROR: Error conditions and failures
+- SUCCESS: Successful stage completions
+
+### State Inspection
+- Access to intermediate results
+- Workflow state at each stage
+- Message history between agents
+
+## Future Enhancements
+
+### Possible Extensions
+1. **Parallel Processing Agent** - Process multiple files simultaneously
+2. **Validation Agent** - Verify data quality and completeness
+3. **Export Agent** - Generate reports in multiple formats
+4. **Notification Agent** - Send alerts and updates
+
+### Integration Points
+- Database storage for persistent results
+- External API integrations
+- Workflow scheduling and automation
+- Dashboard for workflow monitoring
+
+## Troubleshooting
+
+### Common Issues
+1. **Network connectivity** - Check SEBI website accessibility
+2. **PDF extraction errors** - Verify file integrity
+3. **API failures** - Check PWC GenAI service status
+4. **Path issues** - Ensure proper file permissions
+
+### Debug Mode
+Enable detailed logging by setting appropriate log levels in each agent.
+"""
+_WORKFLOW_DOCUMENTATION_BYTES: Final[bytes] = WORKFLOW_DOCUMENTATION_MD.encode('utf-8')
+
+# Mermaid diagram written by generate_node_relationship_mermaid
+MERMAID_DIAGRAM_FILE = 'workflow_mermaid_diagram.md'
+_MERMAID_DIAGRAM_LINES: Final[Tuple[str, ...]] = (
+    '```mermaid',
+    'graph TD',
+    '    A[START] --> B[Web Scraping Agent]',
+    '    B --> C{Files Downloaded?}',
+    '    C -->|YES| D[Document Processing Agent]',
+    '    C -->|NO| H[Finalize & Report]',
+    '    D --> E{Text Extracted?}',
+    '    E -->|YES| F[Analysis Agent]',
+    '    E -->|NO| H',
+    '    F --> H',
+    '    H --> I[END]',
+    '',
+    '    %% Data sources and outputs',
+    '    J[(SEBI Website)] -.-> B',
+    '    K[(PDF Files)] -.-> D',
+    '    L[(JSON Results)] -.-> F',
+    '    M[(Final Report)] -.-> H',
+    '',
+    '    %% Styling',
+    '    classDef startEnd fill:#4CAF50,stroke:#333,stroke-width:2px,color:#fff',
+    '    classDef agent fill:#2196F3,stroke:#333,stroke-width:2px,color:#fff',
+    '    classDef decision fill:#FF9800,stroke:#333,stroke-width:2px,color:#fff',
+    '    classDef finalize fill:#9C27B0,stroke:#333,stroke-width:2px,color:#fff',
+    '    classDef data fill:#607D8B,stroke:#333,stroke-width:1px,color:#fff',
+    '',
+    '    class A,I startEnd',
+    '    class B,D,F agent',
+    '    class C,E decision',
+    '    class H finalize',
+    '    class J,K,L,M data',
+    '```',
+    '',
+    '## Node Details',
+    '',
+    '### Agents (Processing Nodes)',
+    '- **Web Scraping Agent**: Downloads PDFs from SEBI website with session management',
+    '- **Document Processing Agent**: Extracts text from PDFs using PyMuPDF (PyPDF2/pdfplumber fallback)',
+    '- **Analysis Agent**: Classifies documents using LLM (PWC GenAI API)',
+    '',
+    '### Decision Points',
+    '- **Files Downloaded?**: Checks if scraping was successful (files > 0)',
+    '- **Text Extracted?**: Validates text extraction success (processed_files > 0)',
+    '',
+    '### Control Flow',
+    '- **Sequential Flow**: Each agent processes data and passes to next stage',
+    '- **Conditional Routing**: Decision points route based on success/failure',
+    '- **Error Recovery**: Failed stages route to finalization for graceful completion',
+    '',
+    '### State Management',
+    '- **Persistent State**: LangGraph maintains state across all nodes',
+    '- **Message Passing**: Agents communicate via structured messages',
+    '- **Error Tracking**: All errors collected and reported in final stage',
+)
+MERMAID_DIAGRAM_MD: Final[str] = '\n'.join(_MERMAID_DIAGRAM_LINES) + '\n'
+_MERMAID_DIAGRAM_BYTES: Final[bytes] = MERMAID_DIAGRAM_MD.encode('utf-8')
+
+# Single-archive output used by generate_all_bundled / `--bundle`
+ARTIFACT_BUNDLE_FILE = 'workflow_artifacts.zip'
+
+
+def _write_file_bytes(path, data):
+    """
+    Write already-encoded bytes straight to a file descriptor, bypassing the
+    buffered/text IO layers - the payloads here are written whole, once. The
+    bytes go to a sibling temp file that then replaces the target, so an
+    interrupted run never leaves a truncated artifact behind
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=None)
+def _diagram_cache_key(dpi):
+    """
+    Hash of this module's source and the output DPI - the diagram layout, colors and
+    arrows are all literals defined here, so the rendered image only changes when
+    this file or the resolution does. The source cannot change under a running
+    process, so the key is computed once per DPI
+    """
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(str(dpi).encode())
+    return digest.hexdigest()
+
+
+def _premix_on_white(rgba):
+    """
+    Blend an RGBA color over white into the equivalent opaque RGB color
+    """
+    r, g, b, alpha = rgba
+    return (alpha * r + 1 - alpha, alpha * g + 1 - alpha, alpha * b + 1 - alpha)
 
 
 def calculate_node_connection_points(start_node, end_node, sizes_dict):
     """
     Calculate precise connection points on node boundaries for accurate arrows
     """
-    import math
-    
     start_pos = start_node
     end_pos = end_node
     
     # Calculate direction vector
     dx = end_pos[0] - start_pos[0]
     dy = end_pos[1] - start_pos[1]
-    distance = math.sqrt(dx*dx + dy*dy)
+    distance = hypot(dx, dy)
     
     if distance == 0:
         return start_pos, end_pos
@@ -49,12 +588,119 @@ def calculate_node_connection_points(start_node, end_node, sizes_dict):
     return start_connection, end_connection
 
 
-def generate_workflow_diagram():
+def calculate_node_connection_points_batch(starts, ends, start_sizes, end_sizes):
+    """
+    Vectorized calculate_node_connection_points for many edges at once
+    
+    Args:
+        starts: (N, 2) start node centers
+        ends: (N, 2) end node centers
+        start_sizes: (N, 2) width/height of each start node
+        end_sizes: (N, 2) width/height of each end node
+        
+    Returns:
+        Tuple of (N, 2) arrays with the start and end connection points
+    """
+    import numpy as np
+    
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    start_offsets = np.asarray(start_sizes, dtype=float).max(axis=1) * 0.5
+    end_offsets = np.asarray(end_sizes, dtype=float).max(axis=1) * 0.5
+    delta = ends - starts
+    distance = np.linalg.norm(delta, axis=1, keepdims=True)
+    # Zero-length edges keep their original endpoints
+    direction = delta / np.where(distance == 0, 1.0, distance)
+    return starts + direction * start_offsets[:, None], ends - direction * end_offsets[:, None]
+
+
+def straight_arrow_segments(start, end, head_length, head_width, shrink):
+    """
+    Shaft and open ('->') head strokes of a straight arrow as line segments
+    
+    Works in display (pixel) coordinates so the head keeps its shape regardless
+    of the axes aspect ratio, and mirrors FancyArrowPatch: both ends are pulled
+    in by shrink and the head is two strokes meeting at the tip.
+    
+    Args:
+        start: (x, y) start point in pixels
+        end: (x, y) end point in pixels
+        head_length: Length of the head along the shaft in pixels
+        head_width: Half-width of the head across the shaft in pixels
+        shrink: Distance trimmed from each end in pixels
+        
+    Returns:
+        List of ((x0, y0), (x1, y1)) segments; empty for arrows shorter than the shrink
+    """
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length = hypot(dx, dy)
+    if length <= 2 * shrink:
+        return []
+    ux, uy = dx / length, dy / length
+    tail = (start[0] + ux * shrink, start[1] + uy * shrink)
+    tip = (end[0] - ux * shrink, end[1] - uy * shrink)
+    base_x, base_y = tip[0] - ux * head_length, tip[1] - uy * head_length
+    off_x, off_y = -uy * head_width, ux * head_width
+    return [
+        (tail, tip),
+        ((base_x + off_x, base_y + off_y), tip),
+        ((base_x - off_x, base_y - off_y), tip),
+    ]
+
+
+def generate_workflow_diagram(force=False, show=False, hires=False, fmt='png', dpi=None):
     """
     Generate a visual diagram of the SEBI workflow with improved layout and spacing
+    
+    The diagram is static, so an existing image rendered from the current source
+    is reused unless force or show is set. Rendering is headless (Agg) unless show is set,
+    in which case the figure is also displayed interactively. The image is saved at
+    DIAGRAM_DPI, or DIAGRAM_HIRES_DPI when hires is set; an explicit dpi overrides
+    both. fmt='svg' writes a vector image instead, which skips rasterization and
+    PNG encoding entirely
+    
+    Returns:
+        True when the diagram file is current (rendered now or reused), False when
+        matplotlib is missing and only the ASCII diagram was written
     """
-    try:
-        fig, ax = plt.subplots(1, 1, figsize=(20, 14))
+    if dpi is None:
+        dpi = DIAGRAM_HIRES_DPI if hires else DIAGRAM_DPI
+    diagram_file = Path(f"{DIAGRAM_BASENAME}.{fmt}")
+    hash_file = Path(str(diagram_file) + DIAGRAM_HASH_SUFFIX)
+    cache_key = _diagram_cache_key(dpi)
+    # show=True always renders, since there is no figure to display otherwise
+    if not force and not show and diagram_file.exists() and hash_file.exists() and hash_file.read_text(encoding='ascii', errors='strict') == cache_key:
+        print(f"📊 Workflow diagram is up to date: '{diagram_file}'")
+        return True
+    
+    if not MATPLOTLIB_AVAILABLE:
+        print("⚠️  Matplotlib not installed. Run: pip install matplotlib")
+        generate_ascii_workflow_diagram()
+        return False
+    
+    # Imported here so cache hits never pay for loading matplotlib
+    import matplotlib
+    import matplotlib.patches as patches
+    from matplotlib.collections import LineCollection, PatchCollection
+    from matplotlib.colors import to_rgba
+    from matplotlib.font_manager import FontProperties
+    
+    # Path simplification drops sub-pixel vertices (mostly in the rounded box
+    # corners and curved arrows) before Agg strokes them. Paths read these
+    # settings when created, so the whole figure is built inside the context
+    with matplotlib.rc_context(_DIAGRAM_RC_PARAMS):
+        if show:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(20, 14))
+        else:
+            # Headless render straight to the file on an Agg canvas of its own,
+            # leaving the process-wide pyplot backend untouched
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(20, 14))
+            FigureCanvasAgg(fig)
+        ax = fig.subplots(1, 1)
+        fig.subplots_adjust(**_DIAGRAM_SUBPLOT_PARAMS)
         ax.set_xlim(0, 18)
         ax.set_ylim(0, 14)
         ax.axis('off')
@@ -65,17 +711,6 @@ def generate_workflow_diagram():
         ax.text(9, 12.6, 'Multi-Agent System Architecture', 
                 fontsize=16, ha='center', style='italic', color='#666')
         
-        # Define enhanced colors and styles
-        colors = {
-            'start_end': '#4CAF50',
-            'agent': '#2196F3',
-            'decision': '#FF9800',
-            'finalize': '#9C27B0',
-            'data': '#607D8B',
-            'success_path': '#4CAF50',
-            'error_path': '#f44336',
-            'data_flow': '#9E9E9E'
-        }
         
         # Improved node positions with better spacing
         nodes = {
@@ -89,85 +724,79 @@ def generate_workflow_diagram():
             'END': (16.5, 7)
         }
         
+        # Box styles are parsed once here instead of once per patch
+        fancy_box = patches.FancyBboxPatch
+        agent_boxstyle = patches.BoxStyle(_AGENT_BOXSTYLE)
+        data_boxstyle = patches.BoxStyle(_DATA_BOXSTYLE)
+        
+        def make_box(center, facecolor, edgecolor, size=(3.0, 1.6), boxstyle=agent_boxstyle, alpha=0.9):
+            """Rounded box of the given size centered on a node position"""
+            width, height = size
+            return fancy_box((center[0] - width / 2, center[1] - height / 2), width, height,
+                             boxstyle=boxstyle, facecolor=facecolor, alpha=alpha,
+                             linewidth=2, edgecolor=edgecolor)
+        
+        def make_decision(center):
+            """Decision node; an axis-aligned Rectangle needs no trig to build its path"""
+            half = _DECISION_SIDE / 2
+            return patches.Rectangle((center[0] - half, center[1] - half), _DECISION_SIDE, _DECISION_SIDE,
+                                     facecolor=_DIAGRAM_COLORS['decision'], alpha=0.9,
+                                     linewidth=2, edgecolor='darkorange')
+        
+        # Node shapes are collected and drawn as a single PatchCollection; their
+        # labels are collected as (x, y, text, style) and drawn in one pass
+        node_patches = []
+        node_labels = []
+        
         # Draw START node with enhanced styling
         start_circle = patches.Circle(nodes['START'], 0.5, 
-                                    facecolor=colors['start_end'], alpha=0.9, 
+                                    facecolor=_DIAGRAM_COLORS['start_end'], alpha=0.9, 
                                     linewidth=3, edgecolor='darkgreen')
-        ax.add_patch(start_circle)
-        ax.text(nodes['START'][0], nodes['START'][1], 'START', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=14)
+        node_patches.append(start_circle)
+        node_labels.append((nodes['START'][0], nodes['START'][1], 'START', 'terminal'))
         
         # Draw Web Scraping Agent with improved spacing
-        scraping_rect = patches.FancyBboxPatch((nodes['web_scraping'][0]-1.5, nodes['web_scraping'][1]-0.8), 
-                                             3.0, 1.6, boxstyle="round,pad=0.15",
-                                             facecolor=colors['agent'], alpha=0.9, 
-                                             linewidth=2, edgecolor='darkblue')
-        ax.add_patch(scraping_rect)
-        ax.text(nodes['web_scraping'][0], nodes['web_scraping'][1]+0.3, 'Web Scraping Agent', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=12)
-        ax.text(nodes['web_scraping'][0], nodes['web_scraping'][1]-0.1, '• Download PDFs\n• Extract links\n• Metadata collection', 
-                ha='center', va='center', color='white', fontsize=9)
+        scraping_rect = make_box(nodes['web_scraping'], _DIAGRAM_COLORS['agent'], 'darkblue')
+        node_patches.append(scraping_rect)
+        node_labels.append((nodes['web_scraping'][0], nodes['web_scraping'][1]+0.3, 'Web Scraping Agent', 'title'))
+        node_labels.append((nodes['web_scraping'][0], nodes['web_scraping'][1]-0.1, '• Download PDFs\n• Extract links\n• Metadata collection', 'bullets'))
         
         # Draw Scraping Decision Diamond with better size
-        scraping_diamond = patches.RegularPolygon(nodes['scraping_check'], 4, radius=1.0, 
-                                                orientation=3.14159/4, facecolor=colors['decision'], 
-                                                alpha=0.9, linewidth=2, edgecolor='darkorange')
-        ax.add_patch(scraping_diamond)
-        ax.text(nodes['scraping_check'][0], nodes['scraping_check'][1]+0.15, 'Files', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=11)
-        ax.text(nodes['scraping_check'][0], nodes['scraping_check'][1]-0.15, 'Downloaded?', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=11)
+        scraping_diamond = make_decision(nodes['scraping_check'])
+        node_patches.append(scraping_diamond)
+        node_labels.append((nodes['scraping_check'][0], nodes['scraping_check'][1]+0.15, 'Files', 'decision'))
+        node_labels.append((nodes['scraping_check'][0], nodes['scraping_check'][1]-0.15, 'Downloaded?', 'decision'))
         
         # Draw Document Processing Agent with better positioning
-        processing_rect = patches.FancyBboxPatch((nodes['doc_processing'][0]-1.5, nodes['doc_processing'][1]-0.8), 
-                                               3.0, 1.6, boxstyle="round,pad=0.15",
-                                               facecolor=colors['agent'], alpha=0.9, 
-                                               linewidth=2, edgecolor='darkblue')
-        ax.add_patch(processing_rect)
-        ax.text(nodes['doc_processing'][0], nodes['doc_processing'][1]+0.3, 'Document Processing Agent', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=12)
-        ax.text(nodes['doc_processing'][0], nodes['doc_processing'][1]-0.1, '• PDF text extraction\n• Metadata parsing\n• Content validation', 
-                ha='center', va='center', color='white', fontsize=9)
+        processing_rect = make_box(nodes['doc_processing'], _DIAGRAM_COLORS['agent'], 'darkblue')
+        node_patches.append(processing_rect)
+        node_labels.append((nodes['doc_processing'][0], nodes['doc_processing'][1]+0.3, 'Document Processing Agent', 'title'))
+        node_labels.append((nodes['doc_processing'][0], nodes['doc_processing'][1]-0.1, '• PDF text extraction\n• Metadata parsing\n• Content validation', 'bullets'))
         
         # Draw Processing Decision Diamond
-        processing_diamond = patches.RegularPolygon(nodes['processing_check'], 4, radius=1.0, 
-                                                  orientation=3.14159/4, facecolor=colors['decision'], 
-                                                  alpha=0.9, linewidth=2, edgecolor='darkorange')
-        ax.add_patch(processing_diamond)
-        ax.text(nodes['processing_check'][0], nodes['processing_check'][1]+0.15, 'Text', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=11)
-        ax.text(nodes['processing_check'][0], nodes['processing_check'][1]-0.15, 'Extracted?', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=11)
+        processing_diamond = make_decision(nodes['processing_check'])
+        node_patches.append(processing_diamond)
+        node_labels.append((nodes['processing_check'][0], nodes['processing_check'][1]+0.15, 'Text', 'decision'))
+        node_labels.append((nodes['processing_check'][0], nodes['processing_check'][1]-0.15, 'Extracted?', 'decision'))
         
         # Draw Analysis Agent
-        analysis_rect = patches.FancyBboxPatch((nodes['analysis'][0]-1.5, nodes['analysis'][1]-0.8), 
-                                             3.0, 1.6, boxstyle="round,pad=0.15",
-                                             facecolor=colors['agent'], alpha=0.9, 
-                                             linewidth=2, edgecolor='darkblue')
-        ax.add_patch(analysis_rect)
-        ax.text(nodes['analysis'][0], nodes['analysis'][1]+0.3, 'Analysis Agent', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=12)
-        ax.text(nodes['analysis'][0], nodes['analysis'][1]-0.1, '• LLM Classification\n• Department mapping\n• Key insights extraction', 
-                ha='center', va='center', color='white', fontsize=9)
+        analysis_rect = make_box(nodes['analysis'], _DIAGRAM_COLORS['agent'], 'darkblue')
+        node_patches.append(analysis_rect)
+        node_labels.append((nodes['analysis'][0], nodes['analysis'][1]+0.3, 'Analysis Agent', 'title'))
+        node_labels.append((nodes['analysis'][0], nodes['analysis'][1]-0.1, '• LLM Classification\n• Department mapping\n• Key insights extraction', 'bullets'))
         
         # Draw Finalize Node with enhanced styling
-        finalize_rect = patches.FancyBboxPatch((nodes['finalize'][0]-1.5, nodes['finalize'][1]-0.8), 
-                                             3.0, 1.6, boxstyle="round,pad=0.15",
-                                             facecolor=colors['finalize'], alpha=0.9, 
-                                             linewidth=2, edgecolor='darkmagenta')
-        ax.add_patch(finalize_rect)
-        ax.text(nodes['finalize'][0], nodes['finalize'][1]+0.3, 'Finalize & Report', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=12)
-        ax.text(nodes['finalize'][0], nodes['finalize'][1]-0.1, '• Generate reports\n• Save results\n• Cleanup', 
-                ha='center', va='center', color='white', fontsize=9)
+        finalize_rect = make_box(nodes['finalize'], _DIAGRAM_COLORS['finalize'], 'darkmagenta')
+        node_patches.append(finalize_rect)
+        node_labels.append((nodes['finalize'][0], nodes['finalize'][1]+0.3, 'Finalize & Report', 'title'))
+        node_labels.append((nodes['finalize'][0], nodes['finalize'][1]-0.1, '• Generate reports\n• Save results\n• Cleanup', 'bullets'))
         
         # Draw END node with enhanced styling
         end_circle = patches.Circle(nodes['END'], 0.5, 
-                                  facecolor=colors['start_end'], alpha=0.9, 
+                                  facecolor=_DIAGRAM_COLORS['start_end'], alpha=0.9, 
                                   linewidth=3, edgecolor='darkgreen')
-        ax.add_patch(end_circle)
-        ax.text(nodes['END'][0], nodes['END'][1], 'END', 
-                ha='center', va='center', fontweight='bold', color='white', fontsize=14)
+        node_patches.append(end_circle)
+        node_labels.append((nodes['END'][0], nodes['END'][1], 'END', 'terminal'))
         
         # Draw data storage nodes with better positioning
         data_nodes = [
@@ -178,162 +807,168 @@ def generate_workflow_diagram():
         ]
         
         for data_node in data_nodes:
-            data_rect = patches.FancyBboxPatch((data_node['pos'][0]-data_node['size'][0]/2, 
-                                             data_node['pos'][1]-data_node['size'][1]/2), 
-                                             data_node['size'][0], data_node['size'][1], 
-                                             boxstyle="round,pad=0.1",
-                                             facecolor=colors['data'], alpha=0.7, 
-                                             linewidth=2, edgecolor='darkslategray')
-            ax.add_patch(data_rect)
-            ax.text(data_node['pos'][0], data_node['pos'][1], data_node['label'], 
-                    ha='center', va='center', fontweight='bold', color='white', fontsize=10)
+            data_rect = make_box(data_node['pos'], _DIAGRAM_COLORS['data'], 'darkslategray',
+                                 size=data_node['size'], boxstyle=data_boxstyle, alpha=0.7)
+            node_patches.append(data_rect)
+            node_labels.append((data_node['pos'][0], data_node['pos'][1], data_node['label'], 'data'))
+        
+        # Nodes sit on an opaque white background and do not overlap, so fold their
+        # alpha into opaque colors and skip per-pixel blending for the largest fills
+        for patch in node_patches:
+            patch.set_facecolor(_premix_on_white(patch.get_facecolor()))
+            patch.set_edgecolor(_premix_on_white(patch.get_edgecolor()))
+            patch.set_alpha(None)
+        
+        ax.add_collection(PatchCollection(node_patches, match_original=True), autolim=False)
+        # One FontProperties per label style instead of resolving size/weight per label
+        node_text_kwargs = {}
+        for style, options in _NODE_TEXT_STYLES.items():
+            kwargs = {key: value for key, value in options.items() if key not in ('fontsize', 'fontweight')}
+            kwargs['fontproperties'] = FontProperties(size=options['fontsize'],
+                                                      weight=options.get('fontweight', 'normal'))
+            node_text_kwargs[style] = kwargs
+        for x, y, text, style in node_labels:
+            ax.text(x, y, text, **node_text_kwargs[style])
         
-        # Define node sizes for accurate connection point calculation
-        node_sizes = {
-            'circle': (1.0, 1.0),      # START/END nodes
-            'agent': (3.0, 1.6),       # Agent rectangles
-            'decision': (2.0, 2.0),    # Decision diamonds
-            'data': (1.4, 1.0)         # Data storage nodes
-        }
         
         # Draw precisely connected workflow arrows with professional styling
         arrows = [
             # Main workflow path connections - clean horizontal/vertical routing
-            {'start': nodes['START'], 'end': nodes['web_scraping'], 'label': 'Initialize Workflow', 
-             'color': colors['success_path'], 'curve': False, 'start_type': 'circle', 'end_type': 'agent',
-             'style': 'solid', 'weight': 'heavy'},
-            {'start': nodes['web_scraping'], 'end': nodes['scraping_check'], 'label': 'Validate Download', 
-             'color': colors['success_path'], 'curve': False, 'start_type': 'agent', 'end_type': 'decision',
-             'style': 'solid', 'weight': 'heavy'},
+            ArrowSpec(start=nodes['START'], end=nodes['web_scraping'], label='Initialize Workflow', 
+                      color=_DIAGRAM_COLORS['success_path'], curve=False, start_type='circle', end_type='agent',
+                      style='solid', weight='heavy'),
+            ArrowSpec(start=nodes['web_scraping'], end=nodes['scraping_check'], label='Validate Download', 
+                      color=_DIAGRAM_COLORS['success_path'], curve=False, start_type='agent', end_type='decision',
+                      style='solid', weight='heavy'),
             
             # Conditional routing with clean curves
-            {'start': nodes['scraping_check'], 'end': nodes['doc_processing'], 'label': 'Files Available', 
-             'color': colors['success_path'], 'curve': True, 'start_type': 'decision', 'end_type': 'agent',
-             'style': 'solid', 'weight': 'heavy', 'curve_direction': 'down-left'},
+            ArrowSpec(start=nodes['scraping_check'], end=nodes['doc_processing'], label='Files Available', 
+                      color=_DIAGRAM_COLORS['success_path'], curve=True, start_type='decision', end_type='agent',
+                      style='solid', weight='heavy', curve_direction='down-left'),
             
-            {'start': nodes['doc_processing'], 'end': nodes['processing_check'], 'label': 'Validate Extraction', 
-             'color': colors['success_path'], 'curve': False, 'start_type': 'agent', 'end_type': 'decision',
-             'style': 'solid', 'weight': 'heavy'},
+            ArrowSpec(start=nodes['doc_processing'], end=nodes['processing_check'], label='Validate Extraction', 
+                      color=_DIAGRAM_COLORS['success_path'], curve=False, start_type='agent', end_type='decision',
+                      style='solid', weight='heavy'),
             
-            {'start': nodes['processing_check'], 'end': nodes['analysis'], 'label': 'Text Available', 
-             'color': colors['success_path'], 'curve': True, 'start_type': 'decision', 'end_type': 'agent',
-             'style': 'solid', 'weight': 'heavy', 'curve_direction': 'down-left'},
+            ArrowSpec(start=nodes['processing_check'], end=nodes['analysis'], label='Text Available', 
+                      color=_DIAGRAM_COLORS['success_path'], curve=True, start_type='decision', end_type='agent',
+                      style='solid', weight='heavy', curve_direction='down-left'),
             
-            {'start': nodes['analysis'], 'end': nodes['finalize'], 'label': 'Analysis Complete', 
-             'color': colors['success_path'], 'curve': True, 'start_type': 'agent', 'end_type': 'agent',
-             'style': 'solid', 'weight': 'heavy', 'curve_direction': 'up-right'},
+            ArrowSpec(start=nodes['analysis'], end=nodes['finalize'], label='Analysis Complete', 
+                      color=_DIAGRAM_COLORS['success_path'], curve=True, start_type='agent', end_type='agent',
+                      style='solid', weight='heavy', curve_direction='up-right'),
             
-            {'start': nodes['finalize'], 'end': nodes['END'], 'label': 'Workflow Complete', 
-             'color': colors['success_path'], 'curve': False, 'start_type': 'agent', 'end_type': 'circle',
-             'style': 'solid', 'weight': 'heavy'},
+            ArrowSpec(start=nodes['finalize'], end=nodes['END'], label='Workflow Complete', 
+                      color=_DIAGRAM_COLORS['success_path'], curve=False, start_type='agent', end_type='circle',
+                      style='solid', weight='heavy'),
             
             # Error paths with distinct styling
-            {'start': nodes['scraping_check'], 'end': nodes['finalize'], 'label': 'No Files Found', 
-             'color': colors['error_path'], 'curve': True, 'start_type': 'decision', 'end_type': 'agent',
-             'style': 'dashed', 'weight': 'medium', 'curve_direction': 'up-right'},
-            {'start': nodes['processing_check'], 'end': nodes['finalize'], 'label': 'No Text Extracted', 
-             'color': colors['error_path'], 'curve': True, 'start_type': 'decision', 'end_type': 'agent',
-             'style': 'dashed', 'weight': 'medium', 'curve_direction': 'right'}
+            ArrowSpec(start=nodes['scraping_check'], end=nodes['finalize'], label='No Files Found', 
+                      color=_DIAGRAM_COLORS['error_path'], curve=True, start_type='decision', end_type='agent',
+                      style='dashed', weight='medium', curve_direction='up-right'),
+            ArrowSpec(start=nodes['processing_check'], end=nodes['finalize'], label='No Text Extracted', 
+                      color=_DIAGRAM_COLORS['error_path'], curve=True, start_type='decision', end_type='agent',
+                      style='dashed', weight='medium', curve_direction='right')
         ]
         
         # Professional data flow arrows with subtle styling
         data_arrows = [
-            {'start': (2.7, 8.5), 'end': (4.5, 9.8), 'label': 'Web Source', 
-             'color': colors['data_flow'], 'curve': True, 'style': 'dotted', 'weight': 'light'},
-            {'start': (2.7, 6.0), 'end': (4.5, 7.2), 'label': 'File Input', 
-             'color': colors['data_flow'], 'curve': True, 'style': 'dotted', 'weight': 'light'},
-            {'start': (7.5, 4.9), 'end': (9.3, 3.5), 'label': 'JSON Output', 
-             'color': colors['data_flow'], 'curve': True, 'style': 'dotted', 'weight': 'light'},
-            {'start': (14.0, 6.2), 'end': (14.0, 3.8), 'label': 'Reports', 
-             'color': colors['data_flow'], 'curve': False, 'style': 'dotted', 'weight': 'light'}
+            ArrowSpec(start=(2.7, 8.5), end=(4.5, 9.8), label='Web Source', 
+                      color=_DIAGRAM_COLORS['data_flow'], curve=True, style='dotted', weight='light'),
+            ArrowSpec(start=(2.7, 6.0), end=(4.5, 7.2), label='File Input', 
+                      color=_DIAGRAM_COLORS['data_flow'], curve=True, style='dotted', weight='light'),
+            ArrowSpec(start=(7.5, 4.9), end=(9.3, 3.5), label='JSON Output', 
+                      color=_DIAGRAM_COLORS['data_flow'], curve=True, style='dotted', weight='light'),
+            ArrowSpec(start=(14.0, 6.2), end=(14.0, 3.8), label='Reports', 
+                      color=_DIAGRAM_COLORS['data_flow'], curve=False, style='dotted', weight='light')
         ]
         
         # Combine all arrows for professional rendering
         all_arrows = arrows + data_arrows
         
-        for arrow in all_arrows:
-            # Professional styling based on arrow properties
-            weight = arrow.get('weight', 'medium')
-            style_type = arrow.get('style', 'solid')
-            
-            # Set line properties based on weight and style
-            if weight == 'heavy':
-                linewidth = 4
-                alpha = 0.95
-                arrowstyle = '->'
-                head_width = 0.8
-            elif weight == 'medium':
-                linewidth = 3
-                alpha = 0.8
-                arrowstyle = '->'
-                head_width = 0.6
-            else:  # light
-                linewidth = 2
-                alpha = 0.6
-                arrowstyle = '->'
-                head_width = 0.4
-            
-            # Set line style
-            if style_type == 'dashed':
-                linestyle = '--'
-            elif style_type == 'dotted':
-                linestyle = ':'
-            else:
-                linestyle = '-'
-            
-            # Calculate precise connection points for workflow arrows
-            if 'start_type' in arrow and 'end_type' in arrow:
-                start_size = node_sizes.get(arrow['start_type'], node_sizes['agent'])
-                end_size = node_sizes.get(arrow['end_type'], node_sizes['agent'])
-                
-                # Calculate boundary connection points with professional spacing
-                start_conn, end_conn = calculate_node_connection_points(
-                    arrow['start'], arrow['end'], 
-                    {'start': start_size, 'end': end_size}
-                )
-            else:
-                # Use manual coordinates for data flow arrows
-                start_conn, end_conn = arrow['start'], arrow['end']
+        # Precise boundary connection points for all workflow arrows in one pass;
+        # data flow arrows use their manual coordinates
+        start_conns, end_conns = calculate_node_connection_points_batch(
+            [a.start for a in arrows],
+            [a.end for a in arrows],
+            [_NODE_SIZES.get(a.start_type, _NODE_SIZES['agent']) for a in arrows],
+            [_NODE_SIZES.get(a.end_type, _NODE_SIZES['agent']) for a in arrows]
+        )
+        start_points = [tuple(p) for p in start_conns] + [a.start for a in data_arrows]
+        end_points = [tuple(p) for p in end_conns] + [a.end for a in data_arrows]
+        
+        # Transpose the arrow specs into parallel per-attribute columns once, so the
+        # render loop walks plain sequences
+        labels = [a.label for a in all_arrows]
+        arrow_colors = [a.color for a in all_arrows]
+        weights = [a.weight for a in all_arrows]
+        linestyles = [_ARROW_LINESTYLES.get(a.style, '-') for a in all_arrows]
+        # None marks a straight arrow
+        curve_radii = [_CURVE_RADII.get(a.curve_direction, 0.25) if a.curve else None
+                       for a in all_arrows]
+        
+        # Straight arrows (shafts and heads) are gathered into one LineCollection;
+        # only curved arrows need a FancyArrowPatch each. Head geometry is built in
+        # pixels to match the '->' style at the same mutation scale
+        mutation_scale = matplotlib.rcParams['font.size']
+        px_per_point = fig.dpi / 72
+        to_pixels = ax.transData.transform
+        to_data = ax.transData.inverted().transform
+        # Arrow/connection styles, colors and label fonts are built once up front and shared,
+        # instead of re-parsing the same strings for every arrow and label
+        arrow_styles = {head_width: patches.ArrowStyle('->', head_width=head_width)
+                        for _, _, head_width in _ARROW_WEIGHTS.values()}
+        connection_styles = {radius: patches.ConnectionStyle('arc3', rad=radius)
+                             for radius in set(curve_radii) if radius is not None}
+        rgba_by_color = {color: to_rgba(color) for color in set(arrow_colors)}
+        label_fonts = {weight: FontProperties(size=fontsize, weight=fontweight)
+                       for weight, (_, fontsize, fontweight) in _LABEL_STYLES.items()}
+        straight_segments = []
+        straight_colors = []
+        straight_widths = []
+        straight_styles = []
+        
+        for start_conn, end_conn, label, color, weight, linestyle, curve in zip(
+                start_points, end_points, labels, arrow_colors, weights, linestyles, curve_radii):
+            # Line properties from the weight lookup table
+            linewidth, alpha, head_width = _ARROW_WEIGHTS.get(weight, _ARROW_WEIGHTS['light'])
+            curve_radius = curve or 0
+            color = rgba_by_color[color]
             
-            # Professional curve radius based on arrow type
-            if arrow.get('curve', False):
-                curve_direction = arrow.get('curve_direction', 'default')
-                if curve_direction == 'down-left':
-                    curve_radius = -0.3
-                elif curve_direction == 'up-right':
-                    curve_radius = 0.3
-                elif curve_direction == 'right':
-                    curve_radius = 0.2
-                else:
-                    curve_radius = 0.25
-                
-                # Create professional curved arrows
-                ax.annotate('', xy=end_conn, xytext=start_conn,
-                           arrowprops=dict(
-                               arrowstyle=f'->,head_width={head_width}',
-                               lw=linewidth, 
-                               color=arrow['color'], 
-                               linestyle=linestyle, 
-                               alpha=alpha,
-                               connectionstyle=f"arc3,rad={curve_radius}",
-                               capstyle='round',
-                               joinstyle='round'
-                           ))
+            if curve is None:
+                segments = straight_arrow_segments(
+                    to_pixels(start_conn), to_pixels(end_conn),
+                    head_length=0.4 * mutation_scale * px_per_point,
+                    head_width=head_width * mutation_scale * px_per_point,
+                    shrink=2 * px_per_point
+                )
+                rgba = (*color[:3], alpha)
+                for segment in segments:
+                    straight_segments.append(to_data(segment))
+                    straight_colors.append(rgba)
+                    straight_widths.append(linewidth)
+                    straight_styles.append(linestyle)
             else:
-                # Professional straight arrows
-                ax.annotate('', xy=end_conn, xytext=start_conn,
-                           arrowprops=dict(
-                               arrowstyle=f'->,head_width={head_width}',
-                               lw=linewidth, 
-                               color=arrow['color'], 
-                               linestyle=linestyle, 
-                               alpha=alpha,
-                               capstyle='round',
-                               joinstyle='round'
-                           ))
+                # Draw the arrow patch directly rather than through an empty
+                # annotation; mutation_scale and zorder match what annotate used.
+                # add_artist rather than add_patch: the limits are fixed, so there is
+                # no point recomputing the data limits for every arrow
+                ax.add_artist(patches.FancyArrowPatch(
+                    start_conn, end_conn,
+                    arrowstyle=arrow_styles[head_width],
+                    connectionstyle=connection_styles[curve],
+                    mutation_scale=mutation_scale,
+                    lw=linewidth, 
+                    color=color, 
+                    linestyle=linestyle, 
+                    alpha=alpha,
+                    capstyle='round',
+                    joinstyle='round',
+                    zorder=3
+                ))
             
             # Professional label styling
-            if arrow.get('curve', False):
+            if curve is not None:
                 # For curved arrows, calculate label position at curve peak
                 mid_x = (start_conn[0] + end_conn[0]) / 2
                 if curve_radius > 0:
@@ -345,47 +980,34 @@ def generate_workflow_diagram():
                 mid_x = (start_conn[0] + end_conn[0]) / 2
                 mid_y = (start_conn[1] + end_conn[1]) / 2 + 0.3
                 
-            # Professional label background based on arrow type
-            if weight == 'heavy':
-                label_bg_color = 'white'
-                label_alpha = 0.95
-                label_fontsize = 10
-                label_fontweight = 'bold'
-                border_width = 2
-            elif weight == 'medium':
-                label_bg_color = '#f9f9f9'
-                label_alpha = 0.9
-                label_fontsize = 9
-                label_fontweight = 'semibold'
-                border_width = 1.5
-            else:  # light
-                label_bg_color = '#f5f5f5'
-                label_alpha = 0.8
-                label_fontsize = 8
-                label_fontweight = 'normal'
-                border_width = 1
+            # Professional label styling based on arrow weight
+            label_bbox = _LABEL_STYLES.get(weight, _LABEL_STYLES['light'])[0]
+            label_font = label_fonts.get(weight, label_fonts['light'])
+            if label_bbox is None:
+                bbox = None
+            else:
+                bbox = label_bbox.copy()
+                bbox['edgecolor'] = color
             
             # Render professional labels
-            ax.text(mid_x, mid_y, arrow['label'], 
+            ax.text(mid_x, mid_y, label, 
                     ha='center', va='center', 
-                    fontsize=label_fontsize, 
-                    color=arrow['color'], 
-                    fontweight=label_fontweight,
-                    bbox=dict(
-                        boxstyle='round,pad=0.3', 
-                        facecolor=label_bg_color, 
-                        alpha=label_alpha, 
-                        edgecolor=arrow['color'], 
-                        linewidth=border_width
-                    ))
+                    fontproperties=label_font, 
+                    color=color, 
+                    bbox=bbox)
+        
+        ax.add_collection(LineCollection(straight_segments, colors=straight_colors,
+                                         linewidths=straight_widths, linestyles=straight_styles,
+                                         capstyle='round', joinstyle='round', zorder=3),
+                          autolim=False)
         
         # Add enhanced legend with better positioning
         legend_elements = [
-            patches.Patch(color=colors['start_end'], label='Start/End Nodes'),
-            patches.Patch(color=colors['agent'], label='Processing Agents'),
-            patches.Patch(color=colors['decision'], label='Decision Points'),
-            patches.Patch(color=colors['finalize'], label='Finalization'),
-            patches.Patch(color=colors['data'], label='Data Sources/Outputs')
+            patches.Patch(color=_DIAGRAM_COLORS['start_end'], label='Start/End Nodes'),
+            patches.Patch(color=_DIAGRAM_COLORS['agent'], label='Processing Agents'),
+            patches.Patch(color=_DIAGRAM_COLORS['decision'], label='Decision Points'),
+            patches.Patch(color=_DIAGRAM_COLORS['finalize'], label='Finalization'),
+            patches.Patch(color=_DIAGRAM_COLORS['data'], label='Data Sources/Outputs')
         ]
         legend = ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(0.02, 0.98),
                           fontsize=11, frameon=True, fancybox=True, shadow=True)
@@ -406,28 +1028,11 @@ def generate_workflow_diagram():
                 bbox=dict(boxstyle='round,pad=0.6', facecolor='lightblue', alpha=0.9,
                          edgecolor='steelblue', linewidth=2), verticalalignment='top')
         
-        # Add execution flow indicators
-        flow_indicators = [
-            {'pos': (9, 1), 'text': 'SUCCESS PATH', 'color': colors['success_path']},
-            {'pos': (13, 1), 'text': 'ERROR PATHS', 'color': colors['error_path']},
-            {'pos': (16, 1), 'text': 'DATA FLOW', 'color': colors['data_flow']}
-        ]
-        
-        for indicator in flow_indicators:
-            ax.text(indicator['pos'][0], indicator['pos'][1], indicator['text'], 
-                    ha='center', va='center', fontsize=10, fontweight='bold',
-                    color=indicator['color'],
-                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                             alpha=0.8, edgecolor=indicator['color'], linewidth=2))
-        
-        # Add subtle visual enhancements for professional appearance
-        ax.grid(True, alpha=0.05, linestyle=':', color='gray', linewidth=0.5)
-        
         # Add workflow flow indicators with professional styling
         flow_indicators = [
-            {'pos': (1, 1.5), 'text': 'SUCCESS PATH', 'color': colors['success_path'], 'symbol': '●'},
-            {'pos': (6, 1.5), 'text': 'ERROR PATHS', 'color': colors['error_path'], 'symbol': '●'},
-            {'pos': (11, 1.5), 'text': 'DATA FLOW', 'color': colors['data_flow'], 'symbol': '●'}
+            {'pos': (1, 1.5), 'text': 'SUCCESS PATH', 'color': _DIAGRAM_COLORS['success_path'], 'symbol': '●'},
+            {'pos': (6, 1.5), 'text': 'ERROR PATHS', 'color': _DIAGRAM_COLORS['error_path'], 'symbol': '●'},
+            {'pos': (11, 1.5), 'text': 'DATA FLOW', 'color': _DIAGRAM_COLORS['data_flow'], 'symbol': '●'}
         ]
         
         for indicator in flow_indicators:
@@ -443,380 +1048,94 @@ def generate_workflow_diagram():
                              alpha=0.9, edgecolor=indicator['color'], linewidth=2))
         
         # Professional save with high quality settings
-        plt.tight_layout()
-        plt.savefig('sebi_langgraph_workflow_diagram.png', 
-                   dpi=300, bbox_inches='tight', 
+        # The axes were placed by hand above; bbox_inches='tight' only crops the margins
+        # PNG: fast zlib level and no Software tag, so re-renders of an unchanged
+        # diagram produce byte-identical files
+        save_kwargs = {'pil_kwargs': {'compress_level': 3}, 'metadata': {'Software': None}} if fmt == 'png' else {}
+        fig.savefig(diagram_file, format=fmt,
+                   dpi=dpi, bbox_inches='tight', 
                    facecolor='white', edgecolor='none',
-                   pad_inches=0.2, transparent=False)
-        plt.show()
-        
-        print("📊 Professional LangGraph workflow diagram with enhanced arrows saved as 'sebi_langgraph_workflow_diagram.png'")
-        print("✨ Professional Improvements:")
-        print("   🎯 Precise node boundary connections")
-        print("   🔄 Professional arrow styling with weight-based rendering")
-        print("   📏 Smart curve radius and direction control")
-        print("   🎨 Color-coded arrow types (heavy/medium/light)")
-        print("   📊 Enhanced label positioning and styling")
-        print("   💫 Round caps and joins for smooth appearance")
-        print("   🌟 High-resolution output with professional quality")
-        
-    except ImportError:
-        print("⚠️  Matplotlib not installed. Run: pip install matplotlib")
-        generate_ascii_workflow_diagram()
+                   pad_inches=0.2, transparent=False,
+                   **save_kwargs)
+        hash_file.write_text(cache_key, encoding='ascii', errors='strict', newline='\n')
+        if show:
+            plt.show()
+            plt.close(fig)
+    
+    print(f"📊 Professional LangGraph workflow diagram with enhanced arrows saved as '{diagram_file}'")
+    print("✨ Professional Improvements:")
+    print("   🎯 Precise node boundary connections")
+    print("   🔄 Professional arrow styling with weight-based rendering")
+    print("   📏 Smart curve radius and direction control")
+    print("   🎨 Color-coded arrow types (heavy/medium/light)")
+    print("   📊 Enhanced label positioning and styling")
+    print("   💫 Round caps and joins for smooth appearance")
+    print("   🌟 High-resolution output with professional quality")
+    return True
 
 
 def generate_ascii_workflow_diagram():
     """
     Generate an improved ASCII representation of the workflow with better spacing and layout
     """
-    ascii_diagram = """
-    ┌─────────────────────────────────────────────────────────────────────────────────────────┐
-    │                      LangGraph SEBI Document Processing Workflow                         │
-    │                             Multi-Agent System Architecture                              │
-    └─────────────────────────────────────────────────────────────────────────────────────────┘
-    
-    
-         ┌─────────────┐
-         │    START    │
-         └──────┬──────┘
-                │
-                │ Initialize Workflow
-                │
-                ▼
-    ┌─────────────────────────────┐              ┌─────────────────────┐
-    │       Web Scraping          │◄─────────────│     SEBI Website    │
-    │         Agent               │              │    (Data Source)    │
-    │                             │              └─────────────────────┘
-    │  • Download PDF files       │
-    │  • Extract document links   │
-    │  • Collect metadata         │
-    │  • Session management       │
-    └─────────────┬───────────────┘
-                  │
-                  │ Validate Downloaded Files
-                  │
-                  ▼
-            ┌─────────────────┐
-            │  Files Present  │
-            │  & Accessible?  │ ◄──── Decision Point 1
-            └─────┬─────┬─────┘
-                  │     │
-         SUCCESS  │     │  NO FILES
-                  │     └─────────────────┐
-                  ▼                       │
-    ┌─────────────────────────────┐       │              ┌─────────────────────┐
-    │    Document Processing      │       │              │     PDF Files       │
-    │         Agent               │◄──────┼──────────────│   (File System)     │
-    │                             │       │              └─────────────────────┘
-    │  • Extract text content     │       │
-    │  • Parse document metadata  │       │
-    │  • Validate content format  │       │
-    │  • Handle extraction errors │       │
-    └─────────────┬───────────────┘       │
-                  │                       │
-                  │ Validate Extracted Text│
-                  │                       │
-                  ▼                       │
-            ┌─────────────────┐           │
-            │  Text Content   │           │
-            │   Available?    │ ◄──── Decision Point 2
-            └─────┬─────┬─────┘           │
-                  │     │                 │
-         SUCCESS  │     │  NO TEXT        │
-                  │     └─────────────────┤
-                  ▼                       │
-    ┌─────────────────────────────┐       │
-    │       Analysis              │       │
-    │        Agent                │       │
-    │                             │       │
-    │  • LLM-based classification │       │
-    │  • Department identification │       │
-    │  • Extract key insights     │       │
-    │  • Generate structured data │       │
-    └─────────────┬───────────────┘       │
-                  │                       │
-                  │ Analysis Complete     │
-                  │                       │
-                  ▼                       │
-    ┌─────────────────────────────┐       │
-    │      Finalize &             │ ◄─────┘
-    │       Report                │
-    │                             │
-    │  • Aggregate all results    │
-    │  • Generate final reports   │
-    │  • Save output files        │
-    │  • Perform cleanup          │
-    │  • Log workflow statistics  │
-    └─────────────┬───────────────┘
-                  │
-                  │ Workflow Complete
-                  │
-                  ▼
-            ┌─────────────┐
-            │     END     │
-            └─────────────┘
-    
-    
-    ┌─────────────────────────────────────────────────────────────────────────────────────────┐
-    │                                  State Management                                        │
-    ├─────────────────────────────────────────────────────────────────────────────────────────┤
-    │  Input Parameters:                                                                      │
-    │    • page_numbers: List[int]     - SEBI website pages to process                       │
-    │    • download_folder: str        - Target directory for downloaded files               │
-    │                                                                                         │
-    │  Workflow Results:                                                                      │
-    │    • scraping_result: Dict       - Download statistics and file metadata               │
-    │    • processing_result: Dict     - Text extraction results and document info           │
-    │    • analysis_result: Dict       - LLM classification and insights                     │
-    │                                                                                         │
-    │  Workflow Metadata:                                                                     │
-    │    • current_stage: str          - Active processing stage                             │
-    │    • workflow_id: str            - Unique workflow execution identifier                │
-    │    • start_time: str             - Workflow initialization timestamp                   │
-    │    • errors: List[str]           - Comprehensive error collection                      │
-    │    • messages: List[Dict]        - Inter-agent communication log                      │
-    └─────────────────────────────────────────────────────────────────────────────────────────┘
-    
-    
-    ┌─────────────────────────────────────────────────────────────────────────────────────────┐
-    │                                 Execution Paths                                          │
-    ├─────────────────────────────────────────────────────────────────────────────────────────┤
-    │  Success Path (All stages complete):                                                   │
-    │    START → Web Scraping → Files Check → Doc Processing → Text Check → Analysis → END  │
-    │                                                                                         │
-    │  No Files Path (Scraping fails):                                                       │
-    │    START → Web Scraping → Files Check → Finalize → END                                │
-    │                                                                                         │
-    │  No Text Path (Processing fails):                                                      │
-    │    START → Web Scraping → Files Check → Doc Processing → Text Check → Finalize → END  │
-    │                                                                                         │
-    │  Error Handling: Graceful degradation with comprehensive error logging                 │
-    └─────────────────────────────────────────────────────────────────────────────────────────┘
-    
-    
-    ┌─────────────────────────────────────────────────────────────────────────────────────────┐
-    │                                   Output Files                                           │
-    ├─────────────────────────────────────────────────────────────────────────────────────────┤
-    │  Primary Outputs:                                                                       │
-    │    📄 scraping_metadata.json              - Raw scraping data and download statistics   │
-    │    🔍 sebi_document_analysis_results.json - LLM analysis results and classifications    │
-    │                                                                                         │
-    │  Optional Outputs:                                                                      │
-    │    📊 workflow_results_[ID].json          - Complete workflow execution results         │
-    │    📈 workflow_statistics.json            - Performance metrics and timing data        │
-    │                                                                                         │
-    │  File Formats: JSON with UTF-8 encoding, structured for easy programmatic access      │
-    └─────────────────────────────────────────────────────────────────────────────────────────┘
-    """
-    
-    print(ascii_diagram)
+    print(ASCII_WORKFLOW_DIAGRAM)
     
     # Save ASCII diagram to file
-    with open('sebi_workflow_ascii_diagram.txt', 'w', encoding='utf-8') as f:
-        f.write(ascii_diagram)
+    _write_file_bytes(ASCII_WORKFLOW_DIAGRAM_FILE, _ASCII_WORKFLOW_DIAGRAM_BYTES)
     
-    print("📊 ASCII workflow diagram saved as 'sebi_workflow_ascii_diagram.txt'")
+    print(f"📊 ASCII workflow diagram saved as '{ASCII_WORKFLOW_DIAGRAM_FILE}'")
 
 
 def generate_workflow_documentation():
     """
     Generate comprehensive documentation for the workflow
     """
-    doc = """
-# SEBI Document Processing Multi-Agent Workflow
-
-## Overview
-This LangGraph-based multi-agent system processes SEBI (Securities and Exchange Board of India) documents through a structured workflow with three specialized agents.
-
-## Architecture
-
-### Agents
-
-#### 1. Web Scraping Agent
-- **Purpose**: Downloads PDFs from SEBI website using AJAX scraper
-- **Input**: Page numbers, download folder
-- **Output**: Downloaded PDF files and metadata
-- **Technology**: Custom AJAX scraper with session management
-
-#### 2. Document Processing Agent  
-- **Purpose**: Extracts text and metadata from PDF documents
-- **Input**: Downloaded PDF files
-- **Output**: Extracted text content and document metadata
-- **Technology**: PyPDF2 and pdfplumber for comprehensive extraction
-
-#### 3. Analysis Agent
-- **Purpose**: Analyzes and classifies documents using LLM
-- **Input**: Extracted text content
-- **Output**: Classified documents with departments, intermediaries, and key insights
-- **Technology**: PWC GenAI API with structured prompts
-
-### Workflow Flow
-
-```
-START → Web Scraping → [Files Downloaded?] → Document Processing → [Text Extracted?] → Analysis → Finalize → END
-           ↓                                        ↓
-        [No Files]                              [No Text]
-           ↓                                        ↓
-        Finalize ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ← ←
-```
-
-## State Management
-
-The workflow uses a shared state object that includes:
-- Input parameters (page numbers, download folder)
-- Results from each stage
-- Workflow metadata and error tracking
-- Inter-agent messages
-
-## Key Features
-
-### 1. Error Resilience
-- Each agent handles errors gracefully
-- Workflow continues even if individual stages fail
-- Comprehensive error logging and reporting
-
-### 2. Conditional Execution
-- Decisions points check if previous stages succeeded
-- Workflow can skip stages if prerequisites aren't met
-- Smart routing based on intermediate results
-
-### 3. Comprehensive Logging
-- Each agent logs its activities with timestamps
-- Inter-agent messages track workflow progress
-- Final report summarizes entire workflow
-
-### 4. State Persistence
-- LangGraph checkpointer maintains workflow state
-- Enables workflow resumption and debugging
-- Complete audit trail of all operations
-
-## Usage Examples
-
-### Basic Usage
-```python
-from langgraph_workflow import run_sebi_workflow
-
-# Run with default parameters
-result = run_sebi_workflow([1, 2], "test_enhanced_metadata")
-```
-
-### Custom Workflow
-```python
-from langgraph_workflow import WorkflowOrchestrator
-
-orchestrator = WorkflowOrchestrator()
-result = orchestrator.run_workflow([1, 3, 5], "custom_folder")
-```
-
-### Original Sequential Comparison
-```python
-# Original approach (sequential)
-result = scrape_page([1,2], "test_enhanced_metadata")
-result = process_test_enhanced_metadata_pdfs()
-result = run_analysis()
-
-# New approach (multi-agent workflow)
-result = run_sebi_workflow([1,2], "test_enhanced_metadata")
-```
-
-## Output Files
-
-### Generated Files
-1. **scraping_metadata.json** - Raw scraping data and file metadata
-2. **sebi_document_analysis_results.json** - LLM analysis results
-3. **workflow_results_[ID].json** - Complete workflow execution results
-
-### Metadata Structure
-Each file processed includes:
-- Circular number and date extraction
-- SEBI reference identification  
-- Department classification
-- Intermediary identification
-- Key clauses and metrics
-- Actionable items
-
-## Benefits Over Sequential Approach
-
-### 1. Better Error Handling
-- Individual stage failures don't crash entire process
-- Graceful degradation and recovery mechanisms
-- Detailed error reporting and diagnostics
-
-### 2. Improved Observability
-- Real-time progress tracking
-- Inter-agent communication logging
-- Performance metrics and timing
-
-### 3. Enhanced Maintainability
-- Modular agent architecture
-- Clear separation of concerns
-- Easy to extend with new agents
-
-### 4. Workflow Flexibility
-- Conditional execution paths
-- Configurable parameters
-- Multiple workflow patterns supported
-
-## Configuration
-
-### Environment Variables
-- API keys for PWC GenAI service
-- Custom download paths
-- Model selection preferences
-
-### Workflow Parameters
-- Page numbers to scrape
-- Download folder names
-- Processing options
-- Analysis model selection
-
-## Monitoring and Debugging
-
-### Logging Levels
-- INFO: Normal operation messages
-- ERROR: Error conditions and failures
-- SUCCESS: Successful stage completions
-
-### State Inspection
-- Access to intermediate results
-- Workflow state at each stage
-- Message history between agents
-
-## Future Enhancements
-
-### Possible Extensions
-1. **Parallel Processing Agent** - Process multiple files simultaneously
-2. **Validation Agent** - Verify data quality and completeness
-3. **Export Agent** - Generate reports in multiple formats
-4. **Notification Agent** - Send alerts and updates
+    _write_file_bytes(WORKFLOW_DOCUMENTATION_FILE, _WORKFLOW_DOCUMENTATION_BYTES)
+    
+    print(f"📚 Documentation saved as '{WORKFLOW_DOCUMENTATION_FILE}'")
+    return WORKFLOW_DOCUMENTATION_MD
 
-### Integration Points
-- Database storage for persistent results
-- External API integrations
-- Workflow scheduling and automation
-- Dashboard for workflow monitoring
 
-## Troubleshooting
+def _format_type(annotation):
+    """Render a type annotation the way the state schema documents it"""
+    if isinstance(annotation, type):
+        return annotation.__name__
+    return str(annotation).replace('typing.', '')
 
-### Common Issues
-1. **Network connectivity** - Check SEBI website accessibility
-2. **PDF extraction errors** - Verify file integrity
-3. **API failures** - Check PWC GenAI service status
-4. **Path issues** - Ensure proper file permissions
 
-### Debug Mode
-Enable detailed logging by setting appropriate log levels in each agent.
-"""
+def _sync_state_schema(state_schema):
+    """
+    Take field types from WorkflowState itself so the documented schema cannot
+    drift from the TypedDict the graph actually runs on. A WorkflowState field
+    the hand-written schema does not describe is an error, so the pre-commit
+    hook fails until a description is added.
     
+    Args:
+        state_schema: The "state_schema" section of the state flow, updated in place
+    
+    Raises:
+        ValueError: If WorkflowState has fields missing from the schema
+    """
+    field_types = get_type_hints(WorkflowState)
+    documented = {}
+    for group in state_schema.values():
+        documented.update(group)
     
+    undocumented = [field for field in field_types if field not in documented]
+    if undocumented:
+        raise ValueError(
+            f"WorkflowState field(s) {', '.join(undocumented)} have no description in the "
+            "state schema - add them to state_schema in _build_state_flow"
+        )
     
-    print("📚 Documentation saved as 'workflow_documentation.md'")
-    return doc
+    for field, annotation in field_types.items():
+        documented[field]["type"] = _format_type(annotation)
 
 
-def generate_state_flow_json():
+@lru_cache(maxsize=1)
+def _build_state_flow():
     """
-    Generate a JSON representation of the workflow state transitions and node relationships
+    Build the (static) workflow state transitions and node relationships once
     """
     state_flow = {
         "workflow": {
@@ -838,6 +1157,8 @@ def generate_state_flow_json():
                 "description": "Downloads PDFs from SEBI website using AJAX scraper",
                 "function": "web_scraping_agent",
                 "inputs": ["page_numbers", "download_folder"],
+                "sharding": "shard_page_numbers(pages, shard_id, num_shards) / `python app.py --shard i/N` - round-robin split of page_numbers, each shard in its own shards/shard-i-of-N working directory",
+                "max_concurrency": "download_workers (DOWNLOAD_WORKERS = 8), paced by REQUESTS_PER_SECOND",
                 "outputs": ["scraping_result", "downloaded_files_metadata"],
                 "next": ["scraping_check"],
                 "error_handling": "graceful_degradation",
@@ -845,6 +1166,7 @@ def generate_state_flow_json():
                 "retry_count": 3,
                 "capabilities": [
                     "AJAX-based web scraping",
+                    "Concurrent page and PDF fetching",
                     "Session management", 
                     "File download tracking",
                     "Metadata extraction",
@@ -872,9 +1194,12 @@ def generate_state_flow_json():
                 "outputs": ["processing_result", "extracted_text", "document_metadata"],
                 "next": ["processing_check"],
                 "error_handling": "per_file_error_tracking",
-                "libraries": ["PyPDF2", "pdfplumber"],
+                "libraries": ["PyMuPDF", "PyPDF2", "pdfplumber"],
+                "max_workers": "PDF_EXTRACTION_WORKERS (min(8, CPU count))",
+                "cache_manifest": "EXTRACTION_CACHE_PATH (.cache/processed.json), keyed by PDF SHA-256 + EXTRACTION_PIPELINE_VERSION",
                 "capabilities": [
                     "PDF text extraction",
+                    "Parallel per-file extraction",
                     "Metadata parsing",
                     "Content validation",
                     "Format detection",
@@ -899,12 +1224,19 @@ def generate_state_flow_json():
                 "description": "Analyzes and classifies documents using LLM",
                 "function": "analysis_agent", 
                 "inputs": ["processing_result", "extracted_text"],
+                "handoff": "processing_result passed in memory, scraping_metadata.json is not re-read",
+                "batch_size": "ANALYSIS_BATCH_SIZE = 4 documents per LLM call, LLM_MAX_CONCURRENCY = 8 calls in flight",
                 "outputs": ["analysis_result", "classifications", "insights"],
                 "next": ["finalize"],
                 "error_handling": "document_level_errors",
                 "llm_provider": "PWC GenAI API",
+                "llm_cache": "LLM_CACHE_PATH (.llm_cache.sqlite), keyed by SHA-256 of LLM_CACHE_VERSION + request body (prompt, model, temperature, top_p)",
                 "capabilities": [
                     "Document classification",
+                    "Batched multi-doc classification",
+                    "Variable-stacked classification",
+                    "Response caching",
+                    "Content fingerprint deduplication",
                     "Department identification",
                     "Intermediary extraction", 
                     "Key insight generation",
@@ -958,6 +1290,18 @@ def generate_state_flow_json():
                 "analysis_result": {
                     "type": "Dict[str, Any]", 
                     "description": "Results from analysis stage"
+                },
+                "database_result": {
+                    "type": "Dict[str, Any]",
+                    "description": "Outcome of the database loading stage (metadata ID, document count, success or error)"
+                },
+                "workflow_documents": {
+                    "type": "List[Dict[str, Any]]",
+                    "description": "Documents created in the main documents table for this workflow, with their IDs and departments"
+                },
+                "ai_assignments": {
+                    "type": "List[Dict[str, Any]]",
+                    "description": "Team assignments suggested for each workflow document from its department"
                 }
             },
             "metadata_fields": {
@@ -1027,6 +1371,12 @@ def generate_state_flow_json():
                     "filename": "sebi_document_analysis_results.json", 
                     "description": "LLM analysis results and classifications",
                     "generated_by": "analysis_agent"
+                },
+                {
+                    "filename": "sebi_document_analysis_results.jsonl",
+                    "description": "Per-document analyses appended as each batch completes",
+                    "generated_by": "analysis_agent",
+                    "format": "jsonl"
                 }
             ],
             "workflow_outputs": [
@@ -1042,119 +1392,134 @@ def generate_state_flow_json():
             "logging_levels": ["INFO", "ERROR", "SUCCESS"],
             "progress_tracking": "Real-time stage updates",
             "error_handling": "Graceful degradation with error collection",
-            "performance_metrics": ["duration", "success_rates", "file_counts"]
+            "performance_metrics": ["duration", "success_rates", "file_counts", "cache_hit_rate"]
         }
     }
-    
-    
+    _sync_state_schema(state_flow["state_schema"])
     return state_flow
 
 
+@lru_cache(maxsize=1)
+def _state_flow_json_bytes():
+    """
+    Serialize the cached state flow once
+    """
+    return dump_json_bytes(_build_state_flow())
+
+
+def generate_state_flow_json():
+    """
+    Generate a JSON representation of the workflow state transitions and node relationships
+    """
+    _write_file_bytes(STATE_FLOW_JSON_FILE, _state_flow_json_bytes())
+    
+    print(f"🔄 Workflow structure saved as '{STATE_FLOW_JSON_FILE}'")
+    # Callers get their own copy so the cached structure stays pristine
+    return copy.deepcopy(_build_state_flow())
+
+
 def generate_node_relationship_mermaid():
     """
     Generate a Mermaid diagram representation of the workflow
     """
-    mermaid_diagram = """
-    ```mermaid
-    graph TD
-        A[START] --> B[Web Scraping Agent]
-        B --> C{Files Downloaded?}
-        C -->|YES| D[Document Processing Agent]
-        C -->|NO| H[Finalize & Report]
-        D --> E{Text Extracted?}
-        E -->|YES| F[Analysis Agent]
-        E -->|NO| H
-        F --> H
-        H --> I[END]
-        
-        %% Data sources and outputs
-        J[(SEBI Website)] -.-> B
-        K[(PDF Files)] -.-> D
-        L[(JSON Results)] -.-> F
-        M[(Final Report)] -.-> H
-        
-        %% Styling
-        classDef startEnd fill:#4CAF50,stroke:#333,stroke-width:2px,color:#fff
-        classDef agent fill:#2196F3,stroke:#333,stroke-width:2px,color:#fff
-        classDef decision fill:#FF9800,stroke:#333,stroke-width:2px,color:#fff
-        classDef finalize fill:#9C27B0,stroke:#333,stroke-width:2px,color:#fff
-        classDef data fill:#607D8B,stroke:#333,stroke-width:1px,color:#fff
-        
-        class A,I startEnd
-        class B,D,F agent  
-        class C,E decision
-        class H finalize
-        class J,K,L,M data
-    ```
-    
-    ## Node Details
-    
-    ### Agents (Processing Nodes)
-    - **Web Scraping Agent**: Downloads PDFs from SEBI website with session management
-    - **Document Processing Agent**: Extracts text from PDFs using PyPDF2/pdfplumber
-    - **Analysis Agent**: Classifies documents using LLM (PWC GenAI API)
+    _write_file_bytes(MERMAID_DIAGRAM_FILE, _MERMAID_DIAGRAM_BYTES)
     
-    ### Decision Points
-    - **Files Downloaded?**: Checks if scraping was successful (files > 0)
-    - **Text Extracted?**: Validates text extraction success (processed_files > 0)
-    
-    ### Control Flow
-    - **Sequential Flow**: Each agent processes data and passes to next stage
-    - **Conditional Routing**: Decision points route based on success/failure
-    - **Error Recovery**: Failed stages route to finalization for graceful completion
-    
-    ### State Management
-    - **Persistent State**: LangGraph maintains state across all nodes
-    - **Message Passing**: Agents communicate via structured messages
-    - **Error Tracking**: All errors collected and reported in final stage
+    print(f"🌊 Mermaid diagram saved as '{MERMAID_DIAGRAM_FILE}'")
+    return MERMAID_DIAGRAM_MD
+
+
+def generate_all_bundled(path=ARTIFACT_BUNDLE_FILE):
     """
+    Write all text artifacts into a single deflate-compressed zip archive
     
+    Args:
+        path: Destination of the archive
     
+    Returns:
+        str: Path of the written archive
+    """
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as bundle:
+        bundle.writestr(ASCII_WORKFLOW_DIAGRAM_FILE, _ASCII_WORKFLOW_DIAGRAM_BYTES)
+        bundle.writestr(WORKFLOW_DOCUMENTATION_FILE, _WORKFLOW_DOCUMENTATION_BYTES)
+        bundle.writestr(STATE_FLOW_JSON_FILE, _state_flow_json_bytes())
+        bundle.writestr(MERMAID_DIAGRAM_FILE, _MERMAID_DIAGRAM_BYTES)
     
-    print("🌊 Mermaid diagram saved as 'workflow_mermaid_diagram.md'")
-    return mermaid_diagram
+    print(f"📦 Documentation artifacts bundled into '{path}'")
+    return path
+
+
+def _generation_summary(include_diagram):
+    """
+    Build the closing report printed by __main__, listing the PNG diagram only
+    when it was rendered
+    """
+    diagram_lines = (f'   🖼️  {DIAGRAM_BASENAME}.png - Enhanced visual workflow diagram',) if include_diagram else ()
+    return '\n'.join((
+        '',
+        '=' * 80,
+        '✅ All enhanced documentation generated successfully!',
+        '=' * 80,
+        '📁 Generated files with improved layouts:',
+        *diagram_lines,
+        f'   📄 {ASCII_WORKFLOW_DIAGRAM_FILE} - Improved ASCII text diagram',
+        f'   📚 {WORKFLOW_DOCUMENTATION_FILE} - Comprehensive documentation',
+        f'   🔄 {STATE_FLOW_JSON_FILE} - Detailed node structure',
+        f'   🌊 {MERMAID_DIAGRAM_FILE} - Mermaid diagram for web display',
+        '=' * 80,
+        '',
+        '📊 Enhanced Workflow Summary:',
+        '   🤖 Total Processing Agents: 3 (Web Scraping, Document Processing, Analysis)',
+        '   🔀 Decision Points: 2 (File validation, Text validation)',
+        '   📈 Execution Paths: 3 (Success, No Files, No Text)',
+        '   🛡️  Error Handling: Graceful degradation with comprehensive error tracking',
+        '   💾 State Management: Persistent state with LangGraph checkpointer',
+        '   📤 Output Files: 3 primary + 1 optional workflow result file',
+        '',
+        '✨ Layout Improvements:',
+        '   🎯 Better node spacing and positioning for clarity',
+        '   🔄 Enhanced arrow routing with curved connections',
+        '   📏 Improved visual hierarchy and organization',
+        '   🎨 Refined color scheme and professional styling',
+        '   📊 Clearer labels and flow indicators',
+        '   🖼️  Higher resolution output with better quality',
+    )) + '\n'
+
+
+# Closing reports, built once and written in a single call
+GENERATION_SUMMARY: Final[str] = _generation_summary(True)
+GENERATION_SUMMARY_NO_DIAGRAM: Final[str] = _generation_summary(False)
 
 
 if __name__ == "__main__":
+    # Artifact bundle mode - just the text artifacts, in one archive
+    if '--bundle' in sys.argv[1:]:
+        generate_all_bundled()
+        sys.exit(0)
+    
     print("📋 Generating comprehensive workflow documentation and diagrams...")
     print("="*80)
     
-    # Generate all documentation
-    print("\n🖼️  Generating visual workflow diagram...")
-    generate_workflow_diagram()
-    
-    print("\n📚 Generating comprehensive documentation...")
-    generate_workflow_documentation()  
-    
-    print("\n🔄 Generating detailed workflow structure...")
-    generate_state_flow_json()
-    
-    print("\n🌊 Generating Mermaid diagram...")
-    generate_node_relationship_mermaid()
-    
-    print("\n" + "="*80)
-    print("✅ All enhanced documentation generated successfully!")
-    print("="*80)
-    print("📁 Generated files with improved layouts:")
-    print("   🖼️  sebi_langgraph_workflow_diagram.png - Enhanced visual workflow diagram")
-    print("   📄 sebi_workflow_ascii_diagram.txt - Improved ASCII text diagram")  
-    print("   📚 workflow_documentation.md - Comprehensive documentation")
-    print("   🔄 langgraph_workflow_structure.json - Detailed node structure")
-    print("   🌊 workflow_mermaid_diagram.md - Mermaid diagram for web display")
-    print("="*80)
+    # Generate all documentation - the text generators are independent of the
+    # diagram, so they run in worker threads while the diagram renders here
+    # (pyplot has to stay on the main thread)
+    print("\n📚 Generating documentation, workflow structure and Mermaid diagram...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(generate) for generate in (
+            generate_workflow_documentation,
+            generate_state_flow_json,
+            generate_node_relationship_mermaid,
+        )]
+        
+        # Headless runs can skip the diagram, and with it the matplotlib import
+        if '--no-diagram' in sys.argv[1:]:
+            print("\n⏭️  Skipping visual workflow diagram (--no-diagram)")
+            diagram_rendered = False
+        else:
+            print("\n🖼️  Generating visual workflow diagram...")
+            diagram_rendered = generate_workflow_diagram()
+        
+        for future in futures:
+            future.result()
     
-    # Display enhanced summary
-    print("\n📊 Enhanced Workflow Summary:")
-    print("   🤖 Total Processing Agents: 3 (Web Scraping, Document Processing, Analysis)")
-    print("   🔀 Decision Points: 2 (File validation, Text validation)")
-    print("   📈 Execution Paths: 3 (Success, No Files, No Text)")
-    print("   🛡️  Error Handling: Graceful degradation with comprehensive error tracking")
-    print("   💾 State Management: Persistent state with LangGraph checkpointer")
-    print("   📤 Output Files: 3 primary + 1 optional workflow result file")
-    print("\n✨ Layout Improvements:")
-    print("   🎯 Better node spacing and positioning for clarity")
-    print("   🔄 Enhanced arrow routing with curved connections")
-    print("   📏 Improved visual hierarchy and organization")
-    print("   🎨 Refined color scheme and professional styling")
-    print("   📊 Clearer labels and flow indicators")
-    print("   🖼️  Higher resolution output with better quality")
+    sys.stdout.write(GENERATION_SUMMARY if diagram_rendered else GENERATION_SUMMARY_NO_DIAGRAM)
+    sys.stdout.flush()
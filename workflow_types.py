@@ -4,10 +4,24 @@ This module contains the WorkflowState definition and utility functions
 that are used across all agents to avoid circular imports.
 """
 
-from typing import Dict, List, Any, TypedDict, Annotated
+import time
+from typing import Dict, List, Any, TypedDict, Annotated, Literal
 from datetime import datetime
 
 
+# Values the agents write to WorkflowState["current_stage"]
+WorkflowStage = Literal[
+    "initialized",
+    "web_scraping",
+    "document_processing",
+    "document_analysis",
+    "database_loading"
+]
+
+# Levels accepted by log_message
+LogLevel = Literal["INFO", "WARNING", "ERROR", "SUCCESS"]
+
+
 # State definition for the workflow
 class WorkflowState(TypedDict):
     """State that gets passed between agents in the workflow"""
@@ -24,7 +38,7 @@ class WorkflowState(TypedDict):
     ai_assignments: List[Dict[str, Any]]
     
     # Workflow metadata
-    current_stage: str
+    current_stage: WorkflowStage
     workflow_id: str
     start_time: str
     errors: List[str]
@@ -34,9 +48,10 @@ class WorkflowState(TypedDict):
 
 
 # Utility functions
-def log_message(agent_name: str, message: str, level: str = "INFO"):
+def log_message(agent_name: str, message: str, level: LogLevel = "INFO"):
     """Log a message with agent name and timestamp"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
+    # time.strftime formats the local time directly, without building a datetime
+    timestamp = time.strftime("%H:%M:%S")
     print(f"[{timestamp}] {level} - {agent_name}: {message}")
 
 